@@ -10,7 +10,7 @@ from typing import Any, Callable, Awaitable
 import websockets
 from websockets.asyncio.client import ClientConnection
 
-from mycroft.shared.protocol import AuthMessage, parse_server_message, ServerMessage
+from mycroft.shared.protocol import PONG_JSON, AuthMessage, parse_server_json, ServerMessage
 
 logger = logging.getLogger(__name__)
 
@@ -43,15 +43,14 @@ class MycroftClient:
 
                 # Authenticate
                 auth = AuthMessage(api_key=self.api_key, project_id=self.project_id)
-                await self._ws.send(json.dumps(auth.model_dump()))
+                await self._ws.send(auth.model_dump_json())
 
                 self._connected.set()
                 logger.info("Connected to server")
 
                 # Receive loop
                 async for raw in self._ws:
-                    data = json.loads(raw)
-                    msg = parse_server_message(data)
+                    msg = parse_server_json(raw)
 
                     # Track project_id from auth_result
                     if msg.type == "auth_result" and msg.success and msg.project_id:
@@ -59,7 +58,7 @@ class MycroftClient:
 
                     # Handle pings
                     if msg.type == "ping":
-                        await self.send_raw({"type": "pong"})
+                        await self._ws.send(PONG_JSON)
                         continue
 
                     if self.on_message:
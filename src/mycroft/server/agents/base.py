@@ -143,7 +143,11 @@ class BaseAgent(ABC):
         kwargs: dict[str, Any] = {
             "model": settings.anthropic_model,
             "max_tokens": settings.anthropic_max_tokens,
-            "system": system,
+            # The system prompt (step docs included) and tools are identical
+            # across turns of a step, so mark them as a cacheable prefix.
+            "system": [
+                {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}
+            ],
             "messages": messages,
         }
         if tool_defs:
@@ -13,7 +13,7 @@ import re
 from pathlib import Path
 from typing import Any
 
-from mycroft.shared.protocol import ErrorMessage, StepId, WorkerBatchUpdate
+from mycroft.shared.protocol import ErrorMessage, StepId
 from mycroft.server.agents.base import BaseAgent
 from mycroft.server.agents.tools import user_confirm
 from mycroft.server.linear.client import LinearClient
@@ -173,17 +173,7 @@ The user can send these commands:
         # Background task: await completion, then clean up
         asyncio.create_task(self._wait_and_finalize(project_id, orchestrator))
 
-        await manager.send(
-            project_id,
-            WorkerBatchUpdate(
-                total_tasks=orchestrator.state.total_tasks,
-                queued=orchestrator.state.queued,
-                running=orchestrator.state.running,
-                succeeded=orchestrator.state.succeeded,
-                failed=orchestrator.state.failed,
-                blocked=orchestrator.state.blocked,
-            ),
-        )
+        await manager.send_raw(project_id, orchestrator.batch_update_json())
 
     async def _wait_and_finalize(
         self, project_id: str, orchestrator: Orchestrator
@@ -210,21 +200,11 @@ The user can send these commands:
         if orchestrator is None:
             await manager.send(
                 project_id,
-                ErrorMessage(message="No active execution to pause."),
+                ErrorMessage.model_construct(message="No active execution to pause."),
             )
             return
         orchestrator.pause_all()
-        await manager.send(
-            project_id,
-            WorkerBatchUpdate(
-                total_tasks=orchestrator.state.total_tasks,
-                queued=orchestrator.state.queued,
-                running=orchestrator.state.running,
-                succeeded=orchestrator.state.succeeded,
-                failed=orchestrator.state.failed,
-                blocked=orchestrator.state.blocked,
-            ),
-        )
+        await manager.send_raw(project_id, orchestrator.batch_update_json())
 
     async def _handle_resume(self) -> None:
         """Resume all Team Leads."""
@@ -233,21 +213,11 @@ The user can send these commands:
         if orchestrator is None:
             await manager.send(
                 project_id,
-                ErrorMessage(message="No active execution to resume."),
+                ErrorMessage.model_construct(message="No active execution to resume."),
             )
             return
         orchestrator.resume_all()
-        await manager.send(
-            project_id,
-            WorkerBatchUpdate(
-                total_tasks=orchestrator.state.total_tasks,
-                queued=orchestrator.state.queued,
-                running=orchestrator.state.running,
-                succeeded=orchestrator.state.succeeded,
-                failed=orchestrator.state.failed,
-                blocked=orchestrator.state.blocked,
-            ),
-        )
+        await manager.send_raw(project_id, orchestrator.batch_update_json())
 
     async def _handle_status(self) -> None:
         """Send current execution status to the client."""
@@ -256,7 +226,7 @@ The user can send these commands:
         if orchestrator is None:
             await manager.send(
                 project_id,
-                ErrorMessage(message="No active execution."),
+                ErrorMessage.model_construct(message="No active execution."),
             )
             return
         status = orchestrator.get_status()
@@ -269,27 +239,17 @@ The user can send these commands:
         if orchestrator is None:
             await manager.send(
                 project_id,
-                ErrorMessage(message="No active execution."),
+                ErrorMessage.model_construct(message="No active execution."),
             )
             return
         found = orchestrator.resume_service(service_name)
         if not found:
             await manager.send(
                 project_id,
-                ErrorMessage(message=f"Service '{service_name}' not found."),
+                ErrorMessage.model_construct(message=f"Service '{service_name}' not found."),
             )
             return
-        await manager.send(
-            project_id,
-            WorkerBatchUpdate(
-                total_tasks=orchestrator.state.total_tasks,
-                queued=orchestrator.state.queued,
-                running=orchestrator.state.running,
-                succeeded=orchestrator.state.succeeded,
-                failed=orchestrator.state.failed,
-                blocked=orchestrator.state.blocked,
-            ),
-        )
+        await manager.send_raw(project_id, orchestrator.batch_update_json())
 
     # ── Linear population ─────────────────────────────────────
 
@@ -351,7 +311,7 @@ The user can send these commands:
             exec_state.tasks[task.id] = task_record
             exec_state.services[svc_name].task_ids.append(task.id)
 
-        exec_state._recount()
+        exec_state._full_recount()
         logger.info(
             "Populated from Linear: %d services, %d tasks",
             len(exec_state.services),
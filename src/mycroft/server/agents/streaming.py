@@ -5,10 +5,10 @@ from __future__ import annotations
 import logging
 
 from mycroft.shared.protocol import (
-    TextBlockStart,
-    TextBlockEnd,
-    TextDelta,
+    TEXT_BLOCK_END_JSON,
+    TEXT_BLOCK_START_JSON,
     ToolActivity,
+    encode_text_delta,
 )
 from mycroft.server.ws.connection_manager import manager
 
@@ -24,15 +24,15 @@ class StreamRelay:
 
     async def on_text_start(self) -> None:
         self._in_text_block = True
-        await manager.send(self.project_id, TextBlockStart())
+        await manager.send_raw(self.project_id, TEXT_BLOCK_START_JSON)
 
     async def on_text_delta(self, text: str) -> None:
-        await manager.send(self.project_id, TextDelta(delta=text))
+        await manager.send_raw(self.project_id, encode_text_delta(text))
 
     async def on_text_end(self) -> None:
         if self._in_text_block:
             self._in_text_block = False
-            await manager.send(self.project_id, TextBlockEnd())
+            await manager.send_raw(self.project_id, TEXT_BLOCK_END_JSON)
 
     async def on_tool_start(self, tool_name: str) -> None:
         await manager.send(
@@ -21,8 +21,13 @@ class GitHubClientError(Exception):
 class GitHubClient:
     """Async GitHub REST client backed by httpx."""
 
-    def __init__(self, token: str | None = None) -> None:
+    def __init__(
+        self,
+        token: str | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
         self._token = token or settings.github_token
+        self._transport = transport
         self._client: httpx.AsyncClient | None = None
 
     async def _get_client(self) -> httpx.AsyncClient:
@@ -35,6 +40,7 @@ class GitHubClient:
                     "X-GitHub-Api-Version": "2022-11-28",
                 },
                 timeout=30.0,
+                transport=self._transport,
             )
         return self._client
 
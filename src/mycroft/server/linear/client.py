@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+import re
+from itertools import islice
 from typing import Any
 
 import httpx
@@ -21,17 +24,146 @@ from mycroft.server.settings import settings
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _minify(query: str) -> str:
+    """Collapse GraphQL whitespace so each request carries fewer bytes."""
+    return _WHITESPACE_RE.sub(" ", query).strip()
+
+
+# GraphQL documents, minified once at import.
+_CREATE_PROJECT_QUERY = _minify("""
+    mutation($input: ProjectCreateInput!) {
+        projectCreate(input: $input) {
+            success
+            project { id name slugId url }
+        }
+    }
+""")
+_CREATE_ISSUE_QUERY = _minify("""
+    mutation($input: IssueCreateInput!) {
+        issueCreate(input: $input) {
+            success
+            issue { id identifier title url stateId priority parentId }
+        }
+    }
+""")
+_GET_ISSUE_QUERY = _minify("""
+    query($id: String!) {
+        issue(id: $id) {
+            id identifier title url stateId priority parentId
+            description
+            labels { nodes { id name } }
+        }
+    }
+""")
+_LIST_PROJECT_ISSUES_QUERY = _minify("""
+    query($id: String!, $cursor: String) {
+        project(id: $id) {
+            issues(first: 50, after: $cursor) {
+                nodes {
+                    id identifier title url stateId priority parentId
+                    description
+                    labels { nodes { id name } }
+                }
+                pageInfo { hasNextPage endCursor }
+            }
+        }
+    }
+""")
+_UPDATE_ISSUE_STATE_QUERY = _minify("""
+    mutation($id: String!, $input: IssueUpdateInput!) {
+        issueUpdate(id: $id, input: $input) { success }
+    }
+""")
+_CREATE_ISSUE_RELATION_QUERY = _minify("""
+    mutation($input: IssueRelationCreateInput!) {
+        issueRelationCreate(input: $input) {
+            success
+            issueRelation { id issueId relatedIssueId type }
+        }
+    }
+""")
+_ADD_COMMENT_QUERY = _minify("""
+    mutation($input: CommentCreateInput!) {
+        commentCreate(input: $input) {
+            success
+            comment { id body userId createdAt }
+        }
+    }
+""")
+_GET_ISSUE_COMMENTS_QUERY = _minify("""
+    query($id: String!) {
+        issue(id: $id) {
+            comments { nodes { id body userId createdAt } }
+        }
+    }
+""")
+_GET_WORKFLOW_STATES_QUERY = _minify("""
+    query($teamId: String!) {
+        workflowStates(filter: { team: { id: { eq: $teamId } } }) {
+            nodes { id name type }
+        }
+    }
+""")
+_GET_LABELS_QUERY = _minify("""
+    query($teamId: String!) {
+        issueLabels(filter: { team: { id: { eq: $teamId } } }) {
+            nodes { id name }
+        }
+    }
+""")
+_CREATE_LABEL_QUERY = _minify("""
+    mutation($input: IssueLabelCreateInput!) {
+        issueLabelCreate(input: $input) {
+            success
+            issueLabel { id name }
+        }
+    }
+""")
+_CREATE_WEBHOOK_QUERY = _minify("""
+    mutation($input: WebhookCreateInput!) {
+        webhookCreate(input: $input) {
+            success
+            webhook { id }
+        }
+    }
+""")
+
 # Minimum delay between batch requests to avoid rate limits.
 BATCH_DELAY = 0.1
 
+# Attempts per request on 429, and the base for exponential backoff
+# when Linear doesn't send a retry-after header.
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 2.0
+
 
 class LinearClientError(Exception):
     """Raised when Linear API returns an error."""
 
 
+class LinearBatchError(LinearClientError):
+    """Raised when some mutations of a batch failed; the others were applied.
+
+    ``succeeded`` holds the results that were created and ``failed`` the
+    inputs that were not, so a retry can resend only those.
+    """
+
+    def __init__(self, errors: list[Any], succeeded: list[Any], failed: list[Any]) -> None:
+        super().__init__(errors)
+        self.errors = errors
+        self.succeeded = succeeded
+        self.failed = failed
+
+
 class LinearClient:
     """Async Linear GraphQL client backed by httpx."""
 
+    # Aliased mutations sent per request by _batched_mutate.
+    MAX_OPS_PER_BATCH = 25
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -40,6 +172,10 @@ class LinearClient:
         self._api_key = api_key or settings.linear_api_key
         self._api_url = api_url or settings.linear_api_url
         self._client: httpx.AsyncClient | None = None
+        # Cleared while a 429 backoff is in progress so that concurrent
+        # requests wait together instead of each retrying independently.
+        self._rate_limit_clear = asyncio.Event()
+        self._rate_limit_clear.set()
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None or self._client.is_closed:
@@ -50,6 +186,10 @@ class LinearClient:
                     "Content-Type": "application/json",
                 },
                 timeout=30.0,
+                transport=httpx.AsyncHTTPTransport(
+                    retries=MAX_RETRIES,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                ),
             )
         return self._client
 
@@ -57,55 +197,59 @@ class LinearClient:
         if self._client and not self._client.is_closed:
             await self._client.aclose()
 
+    async def _back_off(self, delay: float) -> None:
+        """Pause all requests on this client for `delay` seconds.
+
+        If another request is already backing off, wait for that instead of
+        stacking a second delay on top of it.
+        """
+        if not self._rate_limit_clear.is_set():
+            await self._rate_limit_clear.wait()
+            return
+        self._rate_limit_clear.clear()
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._rate_limit_clear.set()
+
     async def _request(self, query: str, variables: dict[str, Any] | None = None) -> dict:
-        """Execute a GraphQL request with retry on 429."""
+        """Execute a GraphQL request with retry on 429; raise on GraphQL errors."""
+        body = await self._send(query, variables)
+        if "errors" in body:
+            raise LinearClientError(body["errors"])
+        return body.get("data", {})
+
+    async def _send(self, query: str, variables: dict[str, Any] | None = None) -> dict:
+        """Execute a GraphQL request with retry on 429; return the whole response body."""
         client = await self._get_client()
         payload: dict[str, Any] = {"query": query}
         if variables:
             payload["variables"] = variables
 
-        for attempt in range(3):
+        for attempt in range(MAX_RETRIES):
+            await self._rate_limit_clear.wait()
             resp = await client.post("", json=payload)
             if resp.status_code == 429:
-                wait = float(resp.headers.get("retry-after", 2 * (attempt + 1)))
+                wait = _retry_delay(resp, attempt)
                 logger.warning("Linear rate-limited, waiting %.1fs", wait)
-                await asyncio.sleep(wait)
+                await self._back_off(wait)
                 continue
             resp.raise_for_status()
-            body = resp.json()
-            if "errors" in body:
-                raise LinearClientError(body["errors"])
-            return body.get("data", {})
+            return resp.json()
 
-        raise LinearClientError("Rate limit exceeded after 3 retries")
+        raise LinearClientError(f"Rate limit exceeded after {MAX_RETRIES} retries")
 
     # ── Projects ─────────────────────────────────────────────
 
     async def create_project(self, name: str, team_ids: list[str]) -> LinearProject:
-        query = """
-        mutation($input: ProjectCreateInput!) {
-            projectCreate(input: $input) {
-                success
-                project { id name slugId url }
-            }
-        }
-        """
         variables = {"input": {"name": name, "teamIds": team_ids}}
-        data = await self._request(query, variables)
+        data = await self._request(_CREATE_PROJECT_QUERY, variables)
         p = data["projectCreate"]["project"]
         return LinearProject(id=p["id"], name=p["name"], slug_id=p.get("slugId", ""), url=p.get("url", ""))
 
     # ── Issues ───────────────────────────────────────────────
 
     async def create_issue(self, inp: LinearIssueCreateInput) -> LinearIssue:
-        query = """
-        mutation($input: IssueCreateInput!) {
-            issueCreate(input: $input) {
-                success
-                issue { id identifier title url stateId priority parentId }
-            }
-        }
-        """
         variables: dict[str, Any] = {
             "input": {
                 "title": inp.title,
@@ -125,7 +269,7 @@ class LinearClient:
         if inp.assignee_id:
             variables["input"]["assigneeId"] = inp.assignee_id
 
-        data = await self._request(query, variables)
+        data = await self._request(_CREATE_ISSUE_QUERY, variables)
         i = data["issueCreate"]["issue"]
         return LinearIssue(
             id=i["id"],
@@ -138,16 +282,7 @@ class LinearClient:
         )
 
     async def get_issue(self, issue_id: str) -> LinearIssue:
-        query = """
-        query($id: String!) {
-            issue(id: $id) {
-                id identifier title url stateId priority parentId
-                description
-                labels { nodes { id name } }
-            }
-        }
-        """
-        data = await self._request(query, {"id": issue_id})
+        data = await self._request(_GET_ISSUE_QUERY, {"id": issue_id})
         i = data["issue"]
         labels = [
             LinearLabel(id=l["id"], name=l["name"])
@@ -167,20 +302,6 @@ class LinearClient:
 
     async def list_project_issues(self, project_id: str) -> list[LinearIssue]:
         """Fetch all issues belonging to a Linear project (paginated)."""
-        query = """
-        query($id: String!, $cursor: String) {
-            project(id: $id) {
-                issues(first: 50, after: $cursor) {
-                    nodes {
-                        id identifier title url stateId priority parentId
-                        description
-                        labels { nodes { id name } }
-                    }
-                    pageInfo { hasNextPage endCursor }
-                }
-            }
-        }
-        """
         all_issues: list[LinearIssue] = []
         cursor: str | None = None
 
@@ -189,7 +310,7 @@ class LinearClient:
             if cursor:
                 variables["cursor"] = cursor
 
-            data = await self._request(query, variables)
+            data = await self._request(_LIST_PROJECT_ISSUES_QUERY, variables)
             issues_data = data.get("project", {}).get("issues", {})
             nodes = issues_data.get("nodes", [])
 
@@ -227,26 +348,15 @@ class LinearClient:
         return await self.create_issue(inp)
 
     async def update_issue_state(self, issue_id: str, state_id: str) -> None:
-        query = """
-        mutation($id: String!, $input: IssueUpdateInput!) {
-            issueUpdate(id: $id, input: $input) { success }
-        }
-        """
-        await self._request(query, {"id": issue_id, "input": {"stateId": state_id}})
+        await self._request(
+            _UPDATE_ISSUE_STATE_QUERY, {"id": issue_id, "input": {"stateId": state_id}}
+        )
 
     # ── Relations ────────────────────────────────────────────
 
     async def create_issue_relation(
         self, issue_id: str, related_issue_id: str, relation_type: str = "blocks"
     ) -> LinearIssueRelation:
-        query = """
-        mutation($input: IssueRelationCreateInput!) {
-            issueRelationCreate(input: $input) {
-                success
-                issueRelation { id issueId relatedIssueId type }
-            }
-        }
-        """
         variables = {
             "input": {
                 "issueId": issue_id,
@@ -254,7 +364,7 @@ class LinearClient:
                 "type": relation_type,
             }
         }
-        data = await self._request(query, variables)
+        data = await self._request(_CREATE_ISSUE_RELATION_QUERY, variables)
         r = data["issueRelationCreate"]["issueRelation"]
         return LinearIssueRelation(
             id=r["id"],
@@ -266,15 +376,9 @@ class LinearClient:
     # ── Comments ─────────────────────────────────────────────
 
     async def add_comment(self, issue_id: str, body: str) -> LinearComment:
-        query = """
-        mutation($input: CommentCreateInput!) {
-            commentCreate(input: $input) {
-                success
-                comment { id body userId createdAt }
-            }
-        }
-        """
-        data = await self._request(query, {"input": {"issueId": issue_id, "body": body}})
+        data = await self._request(
+            _ADD_COMMENT_QUERY, {"input": {"issueId": issue_id, "body": body}}
+        )
         c = data["commentCreate"]["comment"]
         return LinearComment(
             id=c["id"],
@@ -284,14 +388,7 @@ class LinearClient:
         )
 
     async def get_issue_comments(self, issue_id: str) -> list[LinearComment]:
-        query = """
-        query($id: String!) {
-            issue(id: $id) {
-                comments { nodes { id body userId createdAt } }
-            }
-        }
-        """
-        data = await self._request(query, {"id": issue_id})
+        data = await self._request(_GET_ISSUE_COMMENTS_QUERY, {"id": issue_id})
         nodes = data.get("issue", {}).get("comments", {}).get("nodes", [])
         return [
             LinearComment(
@@ -306,14 +403,7 @@ class LinearClient:
     # ── Workflow states & labels ─────────────────────────────
 
     async def get_workflow_states(self, team_id: str) -> list[LinearWorkflowState]:
-        query = """
-        query($teamId: String!) {
-            workflowStates(filter: { team: { id: { eq: $teamId } } }) {
-                nodes { id name type }
-            }
-        }
-        """
-        data = await self._request(query, {"teamId": team_id})
+        data = await self._request(_GET_WORKFLOW_STATES_QUERY, {"teamId": team_id})
         nodes = data.get("workflowStates", {}).get("nodes", [])
         return [
             LinearWorkflowState(id=n["id"], name=n["name"], type=n.get("type", ""))
@@ -321,28 +411,13 @@ class LinearClient:
         ]
 
     async def get_labels(self, team_id: str) -> list[LinearLabel]:
-        query = """
-        query($teamId: String!) {
-            issueLabels(filter: { team: { id: { eq: $teamId } } }) {
-                nodes { id name }
-            }
-        }
-        """
-        data = await self._request(query, {"teamId": team_id})
+        data = await self._request(_GET_LABELS_QUERY, {"teamId": team_id})
         nodes = data.get("issueLabels", {}).get("nodes", [])
         return [LinearLabel(id=n["id"], name=n["name"]) for n in nodes]
 
     async def create_label(self, team_id: str, name: str, color: str = "#888888") -> LinearLabel:
-        query = """
-        mutation($input: IssueLabelCreateInput!) {
-            issueLabelCreate(input: $input) {
-                success
-                issueLabel { id name }
-            }
-        }
-        """
         data = await self._request(
-            query, {"input": {"teamId": team_id, "name": name, "color": color}}
+            _CREATE_LABEL_QUERY, {"input": {"teamId": team_id, "name": name, "color": color}}
         )
         lbl = data["issueLabelCreate"]["issueLabel"]
         return LinearLabel(id=lbl["id"], name=lbl["name"])
@@ -355,22 +430,53 @@ class LinearClient:
         team_id: str,
         resource_types: list[str] | None = None,
     ) -> str:
-        query = """
-        mutation($input: WebhookCreateInput!) {
-            webhookCreate(input: $input) {
-                success
-                webhook { id }
-            }
-        }
-        """
         inp: dict[str, Any] = {"url": url, "teamId": team_id}
         if resource_types:
             inp["resourceTypes"] = resource_types
-        data = await self._request(query, {"input": inp})
+        data = await self._request(_CREATE_WEBHOOK_QUERY, {"input": inp})
         return data["webhookCreate"]["webhook"]["id"]
 
     # ── Batch helpers ────────────────────────────────────────
 
+    async def _batched_mutate(
+        self,
+        mutation: str,
+        input_type: str,
+        inputs: list[dict[str, Any]],
+        selection: str,
+    ) -> tuple[list[dict[str, Any] | None], list[Any]]:
+        """Run one mutation per input as aliased fields of a few GraphQL documents.
+
+        Inputs are split into chunks of MAX_OPS_PER_BATCH and sent one request
+        per chunk. Returns the mutation payloads in input order, with None for
+        mutations that failed, and the GraphQL errors reported for them.
+        """
+        it = iter(inputs)
+        chunks: list[list[dict[str, Any]]] = []
+        while chunk := list(islice(it, self.MAX_OPS_PER_BATCH)):
+            chunks.append(chunk)
+        logger.debug("Sending %d %s ops in %d batch(es)", len(inputs), mutation, len(chunks))
+
+        results: list[dict[str, Any] | None] = []
+        errors: list[Any] = []
+        for n, chunk in enumerate(chunks):
+            if n:
+                await asyncio.sleep(BATCH_DELAY)
+            params = ", ".join(f"$in{i}: {input_type}!" for i in range(len(chunk)))
+            fields = " ".join(
+                f"op{i}: {mutation}(input: $in{i}) {{ {selection} }}" for i in range(len(chunk))
+            )
+            body = await self._send(
+                f"mutation({params}) {{ {fields} }}",
+                {f"in{i}": inp for i, inp in enumerate(chunk)},
+            )
+            # A failed alias comes back as null next to an entry in "errors";
+            # the other aliases in the document are still applied.
+            data = body.get("data") or {}
+            errors.extend(body.get("errors", []))
+            results.extend(data.get(f"op{i}") for i in range(len(chunk)))
+        return results, errors
+
     async def create_issues_batch(
         self, inputs: list[LinearIssueCreateInput]
     ) -> list[LinearIssue]:
@@ -383,9 +489,43 @@ class LinearClient:
     async def create_relations_batch(
         self, relations: list[tuple[str, str, str]]
     ) -> list[LinearIssueRelation]:
-        """Create multiple issue relations. Each tuple: (issue_id, related_id, type)."""
+        """Create multiple issue relations. Each tuple: (issue_id, related_id, type).
+
+        Raises LinearBatchError listing the relations that were not created if
+        any of them failed; the rest are created either way.
+        """
+        payloads, errors = await self._batched_mutate(
+            "issueRelationCreate",
+            "IssueRelationCreateInput",
+            [
+                {"issueId": issue_id, "relatedIssueId": related_id, "type": rel_type}
+                for issue_id, related_id, rel_type in relations
+            ],
+            "success issueRelation { id issueId relatedIssueId type }",
+        )
         results = []
-        for issue_id, related_id, rel_type in relations:
-            results.append(await self.create_issue_relation(issue_id, related_id, rel_type))
-            await asyncio.sleep(BATCH_DELAY)
+        failed = []
+        for relation, payload in zip(relations, payloads):
+            r = payload.get("issueRelation") if payload else None
+            if not r:
+                failed.append(relation)
+                continue
+            results.append(
+                LinearIssueRelation(
+                    id=r["id"],
+                    issue_id=r["issueId"],
+                    related_issue_id=r["relatedIssueId"],
+                    type=r["type"],
+                )
+            )
+        if failed:
+            raise LinearBatchError(errors, results, failed)
         return results
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float:
+    """Seconds to wait after a 429: retry-after if given, else jittered backoff."""
+    retry_after = resp.headers.get("retry-after")
+    if retry_after is not None:
+        return float(retry_after)
+    return RETRY_BASE_DELAY * 2**attempt + random.uniform(0, 0.25)
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI, WebSocket
 
+from mycroft.server.search.tavily import close_tavily
 from mycroft.server.settings import settings
+from mycroft.server.worker.blocker import close_linear
+from mycroft.server.ws.connection_manager import manager
 from mycroft.server.ws.handler import websocket_endpoint
 from mycroft.server.linear.webhook import router as linear_webhook_router
 import mycroft.server.linear.blocker_webhook  # noqa: F401 — registers handler
@@ -17,7 +22,17 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
 )
 
-app = FastAPI(title="Mycroft Server", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Close shared API clients on shutdown."""
+    yield
+    await close_tavily()
+    await close_linear()
+    await manager.close()
+
+
+app = FastAPI(title="Mycroft Server", version="0.1.0", lifespan=lifespan)
 app.include_router(linear_webhook_router)
 
 
@@ -39,8 +54,19 @@ def cli() -> None:
         port=settings.port,
         reload=False,
         log_level="info",
+        loop=_event_loop(),
     )
 
 
+def _event_loop() -> str:
+    """uvloop when available (ships with uvicorn[standard] off Windows)."""
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        logging.getLogger(__name__).info("uvloop not installed, using asyncio loop")
+        return "asyncio"
+    return "uvloop"
+
+
 if __name__ == "__main__":
     cli()
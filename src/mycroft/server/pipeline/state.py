@@ -15,8 +15,11 @@ class PipelineError(Exception):
     pass
 
 
+_STEP_INDEX: dict[StepId, int] = {step_id: i for i, step_id in enumerate(STEP_ORDER)}
+
+
 def _step_index(step_id: StepId) -> int:
-    return STEP_ORDER.index(step_id)
+    return _STEP_INDEX[step_id]
 
 
 def advance(project: ProjectState) -> StepId:
@@ -11,14 +11,32 @@ from mycroft.server.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Shared client — reuses its HTTP connection pool across searches.
+_tavily_client: AsyncTavilyClient | None = None
+
+
+def _get_client() -> AsyncTavilyClient | None:
+    global _tavily_client
+    if _tavily_client is None and settings.tavily_api_key:
+        _tavily_client = AsyncTavilyClient(api_key=settings.tavily_api_key)
+    return _tavily_client
+
+
+async def close_tavily() -> None:
+    """Close the shared Tavily client (called on server shutdown)."""
+    global _tavily_client
+    if _tavily_client is not None:
+        await _tavily_client.close()
+        _tavily_client = None
+
 
 async def search(query: str, max_results: int = 5) -> list[dict[str, Any]]:
     """Search the web via Tavily. Returns list of {title, url, content}."""
-    if not settings.tavily_api_key:
+    client = _get_client()
+    if client is None:
         logger.warning("Tavily API key not configured, returning empty results")
         return []
 
-    client = AsyncTavilyClient(api_key=settings.tavily_api_key)
     response = await client.search(query=query, max_results=max_results)
 
     results = []
@@ -35,6 +35,7 @@ class ServerSettings(BaseSettings):
 
     # State storage
     data_dir: Path = Path("./data")
+    pretty_state_files: bool = False  # indent execution.json for inspection
 
     # Linear
     linear_api_key: str = ""
@@ -6,7 +6,11 @@ from pathlib import Path
 from typing import Any
 
 from mycroft.shared.protocol import StepId
-from mycroft.server.state.persistence import jsonl_append, jsonl_read
+from mycroft.server.state.persistence import (
+    discard_jsonl,
+    jsonl_append,
+    jsonl_read,
+)
 
 
 def _conv_path(project_dir: Path, step_id: StepId) -> Path:
@@ -23,6 +27,7 @@ def load_messages(project_dir: Path, step_id: StepId) -> list[dict[str, Any]]:
 
 def delete_conversation(project_dir: Path, step_id: StepId) -> None:
     path = _conv_path(project_dir, step_id)
+    discard_jsonl(path)
     path.unlink(missing_ok=True)
 
 
@@ -2,40 +2,174 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import json
 import tempfile
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+# Non-durable JSON writes (deferred_json_write) are coalesced per file and
+# written at most once per JSON_COALESCE_INTERVAL seconds.
+JSON_COALESCE_INTERVAL = 0.1
 
-def atomic_json_write(path: Path, data: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp_fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+_deferred_writes: dict[Path, Callable[[], dict[str, Any] | bytes]] = {}
+_deferred_handles: dict[Path, asyncio.TimerHandle] = {}
+
+# JSONL appends made from async code are buffered per file and written in
+# one go at most JSONL_FLUSH_INTERVAL seconds later, or as soon as
+# JSONL_FLUSH_MAX lines are waiting.
+JSONL_FLUSH_INTERVAL = 0.05
+JSONL_FLUSH_MAX = 64
+
+_append_queue: dict[Path, list[bytes]] = {}
+_flush_handles: dict[Path, asyncio.TimerHandle] = {}
+
+
+@lru_cache(maxsize=1024)
+def _ensure_dir(path: Path) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+
+
+def atomic_json_write(path: Path, data: dict[str, Any] | bytes) -> None:
+    """Atomically replace ``path`` with ``data``.
+
+    ``data`` is either a dict to encode, or JSON that is already encoded
+    (e.g. from ``model_dump_json``) and is written as-is.
+    """
+    _discard_deferred(path)
+    _ensure_dir(path.parent)
+    try:
+        tmp_fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except FileNotFoundError:
+        # Directory was removed since we cached it — recreate.
+        _ensure_dir.cache_clear()
+        _ensure_dir(path.parent)
+        tmp_fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
     try:
-        with open(tmp_fd, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        if isinstance(data, bytes):
+            with open(tmp_fd, "wb") as f:
+                f.write(data)
+        else:
+            with open(tmp_fd, "w") as f:
+                json.dump(data, f, indent=2, default=str)
         Path(tmp_path).replace(path)
     except Exception:
         Path(tmp_path).unlink(missing_ok=True)
         raise
 
 
+def deferred_json_write(
+    path: Path, build: Callable[[], dict[str, Any] | bytes]
+) -> None:
+    """Schedule atomic_json_write(path, build()) for a little later.
+
+    Repeated calls for the same path within the window collapse into one
+    write of the latest data. Outside an event loop, writes immediately.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        atomic_json_write(path, build())
+        return
+    _deferred_writes[path] = build
+    if path not in _deferred_handles:
+        _deferred_handles[path] = loop.call_later(
+            JSON_COALESCE_INTERVAL, _flush_deferred, path
+        )
+
+
+def flush_json_writes(path: Path | None = None) -> None:
+    """Perform pending deferred writes for one file, or for all files."""
+    for p in [path] if path is not None else list(_deferred_writes):
+        _flush_deferred(p)
+
+
+def _flush_deferred(path: Path) -> None:
+    build = _deferred_writes.get(path)
+    _discard_deferred(path)
+    if build is not None:
+        atomic_json_write(path, build())
+
+
+def _discard_deferred(path: Path) -> None:
+    _deferred_writes.pop(path, None)
+    handle = _deferred_handles.pop(path, None)
+    if handle is not None:
+        handle.cancel()
+
+
 def json_read(path: Path) -> dict[str, Any]:
+    _flush_deferred(path)
     return json.loads(path.read_text())
 
 
 def jsonl_append(path: Path, record: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "a") as f:
-        f.write(json.dumps(record, default=str) + "\n")
+    """Append a record. Inside a running event loop the write is batched."""
+    _append_queue.setdefault(path, []).append(
+        (json.dumps(record, default=str) + "\n").encode()
+    )
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if loop is None or len(_append_queue[path]) >= JSONL_FLUSH_MAX:
+        _flush_path(path)
+    elif path not in _flush_handles:
+        _flush_handles[path] = loop.call_later(JSONL_FLUSH_INTERVAL, _flush_path, path)
+
+
+def flush_jsonl(path: Path | None = None) -> None:
+    """Write out buffered appends for one file, or for all files."""
+    for p in [path] if path is not None else list(_append_queue):
+        _flush_path(p)
+
+
+def discard_jsonl(path: Path) -> None:
+    """Drop buffered appends for a file that is about to be deleted."""
+    _append_queue.pop(path, None)
+    handle = _flush_handles.pop(path, None)
+    if handle is not None:
+        handle.cancel()
+
+
+def _flush_path(path: Path) -> None:
+    handle = _flush_handles.pop(path, None)
+    if handle is not None:
+        handle.cancel()
+    batch = _append_queue.pop(path, None)
+    if not batch:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "ab") as f:
+            f.writelines(batch)
+    except OSError:
+        # Keep the lines (ahead of any appended meanwhile) for the next flush
+        _append_queue[path] = batch + _append_queue.get(path, [])
+        raise
+
+
+atexit.register(flush_json_writes)
+atexit.register(flush_jsonl)
 
 
 def jsonl_read(path: Path) -> list[dict[str, Any]]:
-    if not path.exists():
-        return []
+    """Read all records, including appends still buffered in memory.
+
+    Buffered lines are merged in rather than flushed first, so a read right
+    after an append (e.g. an agent loading the message just received) does
+    not put a write on its path.
+    """
     records = []
-    for line in path.read_text().splitlines():
-        line = line.strip()
-        if line:
-            records.append(json.loads(line))
+    if path.exists():
+        for line in path.read_text().splitlines():
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
+    for line in _append_queue.get(path, ()):
+        records.append(json.loads(line))
     return records
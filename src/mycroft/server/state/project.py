@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import os
 import re
 import uuid
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from mycroft.server.settings import settings
 from mycroft.shared.protocol import StepId, StepStatus, STEP_ORDER
+from mycroft.shared.protocol import StepState as ProtoStepState
 from mycroft.server.state.persistence import atomic_json_write, json_read
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
 
 class StepState(BaseModel):
     step_id: StepId
@@ -26,6 +30,11 @@ class ProjectState(BaseModel):
     steps: dict[StepId, StepState] = Field(default_factory=dict)
     metadata: dict[str, Any] = Field(default_factory=dict)
 
+    # (step statuses, protocol step list) last built by sync_steps()
+    _sync_steps: tuple[tuple[StepStatus, ...], list[ProtoStepState]] | None = PrivateAttr(
+        default=None
+    )
+
     def model_post_init(self, __context: Any) -> None:
         for sid in STEP_ORDER:
             if sid not in self.steps:
@@ -33,7 +42,18 @@ class ProjectState(BaseModel):
 
     @property
     def slug(self) -> str:
-        return re.sub(r"[^a-z0-9]+", "-", self.project_name.lower()).strip("-") or self.project_id
+        return _SLUG_RE.sub("-", self.project_name.lower()).strip("-") or self.project_id
+
+    def sync_steps(self) -> list[ProtoStepState]:
+        """Step list for StateSyncMessage, rebuilt only when a status changes."""
+        key = tuple(s.status for s in self.steps.values())
+        if self._sync_steps is None or self._sync_steps[0] != key:
+            steps = [
+                ProtoStepState(step_id=s.step_id, status=s.status)
+                for s in self.steps.values()
+            ]
+            self._sync_steps = (key, steps)
+        return self._sync_steps[1]
 
     @property
     def project_dir(self) -> Path:
@@ -55,11 +75,22 @@ class ProjectState(BaseModel):
 
     @classmethod
     def list_all(cls) -> list[ProjectState]:
-        projects = []
-        projects_dir = settings.projects_dir
-        if not projects_dir.exists():
-            return projects
-        for d in projects_dir.iterdir():
-            if d.is_dir() and (d / "state.json").exists():
-                projects.append(cls.load(d.name))
-        return projects
+        loaded = (cls._read_state(path) for path in _state_paths())
+        return [p for p in loaded if p is not None]
+
+    @classmethod
+    def _read_state(cls, path: Path) -> ProjectState | None:
+        try:
+            data = json_read(path)
+        except FileNotFoundError:
+            return None
+        return cls.model_validate(data)
+
+
+def _state_paths() -> list[Path]:
+    """state.json path for every project dir, gathered in one scandir pass."""
+    try:
+        with os.scandir(settings.projects_dir) as entries:
+            return [Path(e.path) / "state.json" for e in entries if e.is_dir()]
+    except FileNotFoundError:
+        return []
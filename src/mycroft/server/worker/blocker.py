@@ -6,8 +6,11 @@ Same asyncio.Event-based pattern as user_confirm.py, but for execution blockers.
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
 import uuid
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from mycroft.server.linear.client import LinearClient
@@ -23,6 +26,16 @@ logger = logging.getLogger(__name__)
 
 
 class PendingBlocker:
+    __slots__ = (
+        "blocker_id",
+        "service_name",
+        "question",
+        "linear_issue_id",
+        "linear_issue_url",
+        "event",
+        "answer",
+    )
+
     def __init__(
         self,
         blocker_id: str,
@@ -42,11 +55,39 @@ class PendingBlocker:
 
 # Active blockers: blocker_id → PendingBlocker
 _blockers: dict[str, PendingBlocker] = {}
+# Secondary index for webhook lookups: linear_issue_id → blocker_id
+_blockers_by_linear: dict[str, str] = {}
+_blockers_view = MappingProxyType(_blockers)
+
+# Blocker ids: a random per-process prefix plus a counter. The prefix keeps
+# ids unique against blockers restored from a previous run's checkpoint
+# (a pid would not, since containers restart with the same one).
+_ID_PREFIX = uuid.uuid4().hex[:8]
+_id_counter = itertools.count(1)
+
+# Shared Linear client so blocker traffic reuses one connection pool.
+_linear_client: LinearClient | None = None
+
+
+def get_linear_client() -> LinearClient:
+    """Return the shared LinearClient, creating it on first use."""
+    global _linear_client
+    if _linear_client is None:
+        _linear_client = LinearClient()
+    return _linear_client
 
 
-def get_pending_blockers() -> dict[str, PendingBlocker]:
-    """Get all active blockers (for status reporting)."""
-    return dict(_blockers)
+async def close_linear() -> None:
+    """Close the shared LinearClient (called on server shutdown)."""
+    global _linear_client
+    if _linear_client is not None:
+        await _linear_client.close()
+        _linear_client = None
+
+
+def get_pending_blockers() -> Mapping[str, PendingBlocker]:
+    """Read-only live view of all active blockers (for status reporting)."""
+    return _blockers_view
 
 
 def get_blocker(blocker_id: str) -> PendingBlocker | None:
@@ -64,7 +105,7 @@ async def create_blocker(
 
     Returns a PendingBlocker whose .event can be awaited.
     """
-    blocker_id = uuid.uuid4().hex[:8]
+    blocker_id = f"{_ID_PREFIX}{next(_id_counter):04x}"
 
     linear_issue_id = ""
     linear_issue_url = ""
@@ -72,7 +113,7 @@ async def create_blocker(
     # Create Linear issue if configured
     if settings.linear_api_key and settings.linear_team_id:
         try:
-            lc = LinearClient()
+            lc = get_linear_client()
             description = f"## Blocker\n\n**Service**: {service_name}\n\n**Question**: {question}"
             if context:
                 description += f"\n\n**Context**: {context}"
@@ -93,7 +134,6 @@ async def create_blocker(
                 issue.identifier,
                 service_name,
             )
-            await lc.close()
         except Exception:
             logger.exception("Failed to create blocker Linear issue")
 
@@ -104,7 +144,7 @@ async def create_blocker(
         linear_issue_id=linear_issue_id,
         linear_issue_url=linear_issue_url,
     )
-    _blockers[blocker_id] = blocker
+    _register(blocker)
 
     if execution_state:
         execution_state.checkpoint_blocker_created(
@@ -116,14 +156,14 @@ async def create_blocker(
         )
 
     # Notify client
-    await manager.send(
+    await manager.send_raw(
         project_id,
-        BlockerNotification(
+        BlockerNotification.model_construct(
             blocker_id=blocker_id,
             service_name=service_name,
             question=question,
             linear_issue_url=linear_issue_url,
-        ),
+        ).model_dump_json(),
     )
 
     logger.info(
@@ -158,21 +198,30 @@ def resolve_blocker(
 
 def resolve_blocker_by_linear_issue(linear_issue_id: str, answer: str) -> bool:
     """Resolve a blocker by its Linear issue ID (called from webhook)."""
-    for blocker in _blockers.values():
-        if blocker.linear_issue_id == linear_issue_id:
-            return resolve_blocker(blocker.blocker_id, answer)
-    logger.warning("No blocker found for Linear issue %s", linear_issue_id)
-    return False
+    blocker_id = _blockers_by_linear.get(linear_issue_id)
+    if blocker_id is None:
+        logger.warning("No blocker found for Linear issue %s", linear_issue_id)
+        return False
+    return resolve_blocker(blocker_id, answer)
 
 
 def cleanup_blocker(blocker_id: str) -> None:
     """Remove a blocker from the registry after processing."""
-    _blockers.pop(blocker_id, None)
+    blocker = _blockers.pop(blocker_id, None)
+    if blocker and blocker.linear_issue_id:
+        _blockers_by_linear.pop(blocker.linear_issue_id, None)
 
 
 def clear_all_blockers() -> None:
     """Clear all blockers (used in tests and shutdown)."""
     _blockers.clear()
+    _blockers_by_linear.clear()
+
+
+def _register(blocker: PendingBlocker) -> None:
+    _blockers[blocker.blocker_id] = blocker
+    if blocker.linear_issue_id:
+        _blockers_by_linear[blocker.linear_issue_id] = blocker.blocker_id
 
 
 def restore_blockers_from_state(execution_state: ExecutionState) -> list[PendingBlocker]:
@@ -192,6 +241,6 @@ def restore_blockers_from_state(execution_state: ExecutionState) -> list[Pending
             linear_issue_id=record.linear_issue_id,
             linear_issue_url=record.linear_issue_url,
         )
-        _blockers[record.blocker_id] = blocker
+        _register(blocker)
         restored.append(blocker)
     return restored
@@ -6,18 +6,27 @@ after a crash without re-executing completed work.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from mycroft.server.settings import settings
-from mycroft.server.state.persistence import atomic_json_write, json_read
+from mycroft.server.state.persistence import (
+    deferred_json_write,
+    flush_json_writes,
+    json_read,
+)
 
 logger = logging.getLogger(__name__)
 
+# Max concurrent Linear requests while reconciling blockers on recovery.
+RECONCILE_CONCURRENCY = 10
+
 
 class TaskStatus(str, Enum):
     pending = "pending"
@@ -25,6 +34,15 @@ class TaskStatus(str, Enum):
     succeeded = "succeeded"
     failed = "failed"
     blocked = "blocked"
+    aborted = "aborted"  # interrupted by a server restart
+
+
+# Statuses counted under ``ExecutionState.pending``.
+_PENDING_STATUSES = frozenset(
+    {TaskStatus.pending, TaskStatus.in_progress, TaskStatus.blocked, TaskStatus.aborted}
+)
+# Statuses of tasks that are ready to be (re)scheduled.
+_QUEUED_STATUSES = frozenset({TaskStatus.pending, TaskStatus.blocked, TaskStatus.aborted})
 
 
 class SubAgentRecord(BaseModel):
@@ -45,6 +63,7 @@ class TaskRecord(BaseModel):
     attempts: int = 0
     started_at: str = ""
     completed_at: str = ""
+    last_phase: str = ""  # status the task was in when it was aborted
 
 
 class BlockerRecord(BaseModel):
@@ -63,6 +82,9 @@ class ServiceRecord(BaseModel):
     completed_task_ids: list[str] = Field(default_factory=list)
     current_task_id: str = ""
     paused: bool = False
+    # Tasks still waiting to run (pending or blocked), in task_ids order.
+    # Derived from task statuses, so it is rebuilt on load, not persisted.
+    pending_task_ids: list[str] = Field(default_factory=list, exclude=True)
 
 
 class ExecutionState(BaseModel):
@@ -77,24 +99,53 @@ class ExecutionState(BaseModel):
     failed: int = 0
     pending: int = 0
 
+    # execution.json location, resolved from settings on first save.
+    _state_path: Path | None = PrivateAttr(default=None)
+    # Ids of in-progress tasks, kept alongside the counters.
+    _in_progress: set[str] = PrivateAttr(default_factory=set)
+
+    def model_post_init(self, __context: Any) -> None:
+        # Build the derived counters and indexes for states created directly
+        # as well as loaded ones.
+        self._full_recount()
+
     # ── Persistence ──────────────────────────────────────────
 
-    def save(self) -> None:
-        self.updated_at = _now()
-        path = settings.projects_dir / self.project_id / "execution.json"
-        atomic_json_write(path, self.model_dump())
+    def save(self, now: str = "") -> None:
+        """Schedule a checkpoint write.
+
+        Saves made in quick succession are coalesced into a single write of
+        the latest state; call ``flush()`` when the checkpoint must be on
+        disk before continuing. ``now`` lets a checkpoint reuse the timestamp
+        it already took.
+        """
+        self.updated_at = now or _now()
+        deferred_json_write(self._path(), self._dump_json)
+
+    def flush(self) -> None:
+        """Write any pending checkpoint to disk now."""
+        flush_json_writes(self._path())
+
+    def _dump_json(self) -> bytes:
+        indent = 2 if settings.pretty_state_files else None
+        return self.model_dump_json(indent=indent).encode()
+
+    def _path(self) -> Path:
+        if self._state_path is None:
+            self._state_path = settings.projects_dir / self.project_id / "execution.json"
+        return self._state_path
 
     @classmethod
     def load(cls, project_id: str) -> ExecutionState:
         path = settings.projects_dir / project_id / "execution.json"
         data = json_read(path)
-        state = cls.model_validate(data)
-        state._recount()
-        return state
+        return cls.model_validate(data)
 
     @classmethod
     def exists(cls, project_id: str) -> bool:
-        return (settings.projects_dir / project_id / "execution.json").exists()
+        path = settings.projects_dir / project_id / "execution.json"
+        flush_json_writes(path)
+        return path.exists()
 
     # ── Checkpoint methods ───────────────────────────────────
 
@@ -103,12 +154,16 @@ class ExecutionState(BaseModel):
         task = self.tasks.get(task_id)
         if task is None:
             return
+        self._move_counter(task.status, TaskStatus.in_progress)
         task.status = TaskStatus.in_progress
+        self._in_progress.add(task_id)
         task.started_at = _now()
         task.attempts += 1
         service = self.services.get(task.service_name)
         if service:
             service.current_task_id = task_id
+            if task_id in service.pending_task_ids:
+                service.pending_task_ids.remove(task_id)
 
     def checkpoint_task_completed(
         self,
@@ -122,8 +177,12 @@ class ExecutionState(BaseModel):
         task = self.tasks.get(task_id)
         if task is None:
             return
-        task.status = TaskStatus.succeeded if success else TaskStatus.failed
-        task.completed_at = _now()
+        status = TaskStatus.succeeded if success else TaskStatus.failed
+        self._move_counter(task.status, status)
+        task.status = status
+        self._in_progress.discard(task_id)
+        now = _now()
+        task.completed_at = now
         task.pr_url = pr_url
         task.error = error
         if sub_agent_results:
@@ -133,10 +192,11 @@ class ExecutionState(BaseModel):
         if service:
             if success and task_id not in service.completed_task_ids:
                 service.completed_task_ids.append(task_id)
+            if task_id in service.pending_task_ids:
+                service.pending_task_ids.remove(task_id)
             service.current_task_id = ""
 
-        self._recount()
-        self.save()
+        self.save(now)
 
     def checkpoint_blocker_created(
         self,
@@ -155,6 +215,7 @@ class ExecutionState(BaseModel):
             linear_issue_url=linear_issue_url,
         )
         self.save()
+        self.flush()
 
     def checkpoint_blocker_resolved(
         self,
@@ -168,6 +229,7 @@ class ExecutionState(BaseModel):
         blocker.resolved = True
         blocker.answer = answer
         self.save()
+        self.flush()
 
     # ── Query methods ────────────────────────────────────────
 
@@ -176,34 +238,64 @@ class ExecutionState(BaseModel):
         service = self.services.get(service_name)
         if service is None:
             return []
-        return [
-            tid for tid in service.task_ids
-            if tid in self.tasks
-            and self.tasks[tid].status in (TaskStatus.pending, TaskStatus.blocked)
-        ]
+        return list(service.pending_task_ids)
+
+    def get_pending_tasks(self, service_name: str) -> list[TaskRecord]:
+        """Ordered task records not yet completed for a service."""
+        service = self.services.get(service_name)
+        if service is None:
+            return []
+        return [self.tasks[tid] for tid in service.pending_task_ids]
 
     def get_tasks_needing_requeue(self) -> list[str]:
         """Find tasks that were in-progress when the crash happened."""
-        return [
-            tid for tid, task in self.tasks.items()
-            if task.status == TaskStatus.in_progress
-        ]
+        return list(self._in_progress)
 
     # ── Internal helpers ─────────────────────────────────────
 
-    def _recount(self) -> None:
-        """Recompute summary counters from task statuses."""
-        self.succeeded = sum(
-            1 for t in self.tasks.values() if t.status == TaskStatus.succeeded
-        )
-        self.failed = sum(
-            1 for t in self.tasks.values() if t.status == TaskStatus.failed
-        )
-        self.pending = sum(
-            1 for t in self.tasks.values()
-            if t.status in (TaskStatus.pending, TaskStatus.in_progress, TaskStatus.blocked)
-        )
+    def _full_recount(self) -> None:
+        """Recompute summary counters from task statuses in a single pass.
+
+        Also rebuilds each service's ``pending_task_ids`` and the in-progress
+        index. Checkpoints keep all of them up to date incrementally; this is
+        only needed on creation or after bulk-editing ``tasks``/``services``.
+        """
+        succeeded = failed = pending = 0
+        in_progress = set()
+        for tid, t in self.tasks.items():
+            if t.status == TaskStatus.succeeded:
+                succeeded += 1
+            elif t.status == TaskStatus.failed:
+                failed += 1
+            elif t.status in _PENDING_STATUSES:
+                pending += 1
+                if t.status == TaskStatus.in_progress:
+                    in_progress.add(tid)
+        self.succeeded = succeeded
+        self.failed = failed
+        self.pending = pending
         self.total_tasks = len(self.tasks)
+        self._in_progress = in_progress
+        for service in self.services.values():
+            service.pending_task_ids = [
+                tid for tid in service.task_ids
+                if tid in self.tasks and self.tasks[tid].status in _QUEUED_STATUSES
+            ]
+
+    def _move_counter(self, old: TaskStatus, new: TaskStatus) -> None:
+        """Shift one task between summary counters on a status change."""
+        if old == TaskStatus.succeeded:
+            self.succeeded -= 1
+        elif old == TaskStatus.failed:
+            self.failed -= 1
+        else:
+            self.pending -= 1
+        if new == TaskStatus.succeeded:
+            self.succeeded += 1
+        elif new == TaskStatus.failed:
+            self.failed += 1
+        else:
+            self.pending += 1
 
 
 # ── Recovery ─────────────────────────────────────────────────
@@ -216,18 +308,20 @@ async def recover_execution(project_id: str) -> ExecutionState:
     """
     state = ExecutionState.load(project_id)
 
-    # Reset in-progress tasks back to pending (they were interrupted)
+    # Mark in-progress tasks as aborted; they are queued again like pending ones
     requeue = state.get_tasks_needing_requeue()
     for task_id in requeue:
         task = state.tasks[task_id]
-        task.status = TaskStatus.pending
+        task.last_phase = task.status.value
+        task.status = TaskStatus.aborted
+        state._in_progress.discard(task_id)
         task.started_at = ""
         task.completed_at = ""
         # Also clear the service's current_task_id
         service = state.services.get(task.service_name)
         if service and service.current_task_id == task_id:
             service.current_task_id = ""
-        logger.info("Reset interrupted task %s to pending", task_id)
+        logger.info("Marked interrupted task %s as aborted", task_id)
 
     # Reconcile blockers — check Linear for comments on unresolved blockers
     unresolved = [
@@ -237,8 +331,9 @@ async def recover_execution(project_id: str) -> ExecutionState:
     if unresolved:
         await _reconcile_blockers(state, unresolved)
 
-    state._recount()
+    state._full_recount()
     state.save()
+    state.flush()
 
     logger.info(
         "Recovered execution state for project %s: %d succeeded, %d pending, %d requeued",
@@ -255,29 +350,36 @@ async def _reconcile_blockers(
     unresolved: list[BlockerRecord],
 ) -> None:
     """Check Linear for comments that may have resolved blockers while we were down."""
-    from mycroft.server.linear.client import LinearClient
+    from mycroft.server.worker.blocker import get_linear_client
 
     if not settings.linear_api_key:
         return
 
     try:
-        lc = LinearClient()
-        for blocker in unresolved:
-            try:
-                comments = await lc.get_issue_comments(blocker.linear_issue_id)
-                if comments:
-                    # Use the latest comment as the answer
-                    blocker.resolved = True
-                    blocker.answer = comments[-1].body
-                    logger.info(
-                        "Blocker %s resolved via Linear comment during recovery",
-                        blocker.blocker_id,
-                    )
-            except Exception:
+        lc = get_linear_client()
+        limit = asyncio.Semaphore(RECONCILE_CONCURRENCY)
+
+        async def fetch(blocker: BlockerRecord) -> list[Any]:
+            async with limit:
+                return await lc.get_issue_comments(blocker.linear_issue_id)
+
+        results = await asyncio.gather(
+            *(fetch(b) for b in unresolved), return_exceptions=True
+        )
+        for blocker, comments in zip(unresolved, results):
+            if isinstance(comments, BaseException):
                 logger.warning(
                     "Failed to check Linear for blocker %s", blocker.blocker_id
                 )
-        await lc.close()
+                continue
+            if comments:
+                # Use the latest comment as the answer
+                blocker.resolved = True
+                blocker.answer = comments[-1].body
+                logger.info(
+                    "Blocker %s resolved via Linear comment during recovery",
+                    blocker.blocker_id,
+                )
     except Exception:
         logger.exception("Failed to reconcile blockers with Linear")
 
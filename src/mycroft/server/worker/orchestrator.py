@@ -11,15 +11,18 @@ from typing import TYPE_CHECKING, Any
 from mycroft.server.settings import settings
 from mycroft.server.worker.team_lead import TaskResult, TeamLead
 from mycroft.server.ws.connection_manager import manager
-from mycroft.shared.protocol import WorkerBatchUpdate, WorkerStatusUpdate
+from mycroft.shared.protocol import WorkerBatchUpdate, WorkerStatusBatch, WorkerStatusUpdate
 
 if TYPE_CHECKING:
     from mycroft.server.worker.execution_state import ExecutionState
 
 logger = logging.getLogger(__name__)
 
+# Batch updates requested within this window are coalesced into one send.
+BROADCAST_DEBOUNCE = 0.05
 
-@dataclass
+
+@dataclass(slots=True)
 class OrchestratorState:
     total_tasks: int = 0
     queued: int = 0
@@ -29,6 +32,30 @@ class OrchestratorState:
     blocked: int = 0
 
 
+def _status_json(service_name: str, results: list[TaskResult]) -> str:
+    """Final task statuses for one service, as one frame."""
+    if len(results) == 1:
+        r = results[0]
+        return WorkerStatusUpdate.model_construct(
+            task_id=r.task_id,
+            task_title=r.task_title,
+            service_name=service_name,
+            worker_id=service_name,
+            status="succeeded" if r.success else "failed",
+            pr_url=r.pr_url,
+            error=r.error,
+        ).model_dump_json()
+    return WorkerStatusBatch.model_construct(
+        service_name=service_name,
+        worker_id=service_name,
+        task_ids=[r.task_id for r in results],
+        task_titles=[r.task_title for r in results],
+        statuses=["succeeded" if r.success else "failed" for r in results],
+        pr_urls=[r.pr_url for r in results],
+        errors=[r.error for r in results],
+    ).model_dump_json()
+
+
 class Orchestrator:
     """Manages all Team Leads for a project's execution phase."""
 
@@ -39,14 +66,27 @@ class Orchestrator:
     ) -> None:
         self.project_id = project_id
         self.execution_state = execution_state
-        self._leads: dict[str, TeamLead] = {}
-        self._tasks: dict[str, asyncio.Task[list[TaskResult]]] = {}
+        # Leads and their runner tasks are kept in parallel lists, indexed
+        # by service name through _name_to_idx.
+        self._leads: list[TeamLead] = []
+        self._tasks: list[asyncio.Task[list[TaskResult]]] = []
+        self._name_to_idx: dict[str, int] = {}
         self._semaphore = asyncio.Semaphore(settings.worker_max_concurrent_leads)
         self.state = OrchestratorState()
         self._shutdown = False
+        self._broadcast_dirty = asyncio.Event()
+        self._broadcaster: asyncio.Task[None] | None = None
+        # Last batch counters sent and their serialized WorkerBatchUpdate
+        self._last_batch: tuple[int, ...] = ()
+        self._last_batch_json = ""
 
     def add_team_lead(self, lead: TeamLead) -> None:
-        self._leads[lead.service_name] = lead
+        idx = self._name_to_idx.get(lead.service_name)
+        if idx is None:
+            self._name_to_idx[lead.service_name] = len(self._leads)
+            self._leads.append(lead)
+        else:
+            self._leads[idx] = lead
         self.state.total_tasks += len(lead.state.tasks)
         self.state.queued += len(lead.state.tasks)
 
@@ -58,11 +98,13 @@ class Orchestrator:
             len(self._leads),
         )
 
-        for name, lead in self._leads.items():
-            task = asyncio.create_task(self._run_lead(name, lead))
-            self._tasks[name] = task
+        self._broadcaster = asyncio.create_task(self._broadcast_loop())
+        self._tasks = [
+            asyncio.create_task(self._run_lead(lead.service_name, lead))
+            for lead in self._leads
+        ]
 
-        await self._broadcast_batch()
+        self._broadcast_dirty.set()
 
     async def _run_lead(self, name: str, lead: TeamLead) -> list[TaskResult]:
         """Run a Team Lead under the concurrency semaphore."""
@@ -73,7 +115,7 @@ class Orchestrator:
             logger.info("Team Lead [%s] starting", name)
             self.state.running += min(len(lead.state.tasks), 1)
             self.state.queued = max(0, self.state.queued - len(lead.state.tasks))
-            await self._broadcast_batch()
+            self._broadcast_dirty.set()
 
             try:
                 results = await lead.run()
@@ -85,19 +127,9 @@ class Orchestrator:
                         self.state.failed += 1
                     self.state.running = max(0, self.state.running - 1)
 
-                    await manager.send(
-                        self.project_id,
-                        WorkerStatusUpdate(
-                            task_id=r.task_id,
-                            task_title=r.task_title,
-                            service_name=name,
-                            worker_id=name,
-                            status="succeeded" if r.success else "failed",
-                            pr_url=r.pr_url,
-                            error=r.error,
-                        ),
-                    )
-                    await self._broadcast_batch()
+                if results:
+                    await manager.send_raw(self.project_id, _status_json(name, results))
+                    self._broadcast_dirty.set()
 
                 logger.info("Team Lead [%s] finished: %d results", name, len(results))
                 return results
@@ -106,72 +138,111 @@ class Orchestrator:
                 logger.exception("Team Lead [%s] crashed", name)
                 self.state.running = max(0, self.state.running - 1)
                 self.state.failed += len(lead.state.tasks)
-                await self._broadcast_batch()
+                self._broadcast_dirty.set()
                 return []
 
+    async def _broadcast_loop(self) -> None:
+        """Send a batch update shortly after each burst of state changes."""
+        while True:
+            await self._broadcast_dirty.wait()
+            self._broadcast_dirty.clear()
+            await asyncio.sleep(BROADCAST_DEBOUNCE)
+            try:
+                await self._broadcast_batch()
+            except Exception:
+                logger.exception("Batch update for project %s failed", self.project_id)
+
+    async def _stop_broadcaster(self) -> None:
+        """Stop the debounce loop and send one final snapshot."""
+        if self._broadcaster is None:
+            return
+        self._broadcaster.cancel()
+        try:
+            await self._broadcaster
+        except asyncio.CancelledError:
+            pass
+        self._broadcaster = None
+        await self._broadcast_batch()
+
     async def _broadcast_batch(self) -> None:
         """Send batch status update to client."""
-        await manager.send(
-            self.project_id,
-            WorkerBatchUpdate(
-                total_tasks=self.state.total_tasks,
-                queued=self.state.queued,
-                running=self.state.running,
-                succeeded=self.state.succeeded,
-                failed=self.state.failed,
-                blocked=self.state.blocked,
-            ),
-        )
+        await manager.send_raw(self.project_id, self.batch_update_json())
+
+    def batch_update_json(self) -> str:
+        """Serialized WorkerBatchUpdate for the current counters.
+
+        Reused as-is until one of the counters changes.
+        """
+        st = self.state
+        snap = (st.total_tasks, st.queued, st.running, st.succeeded, st.failed, st.blocked)
+        if snap != self._last_batch:
+            self._last_batch = snap
+            self._last_batch_json = WorkerBatchUpdate.model_construct(
+                total_tasks=st.total_tasks,
+                queued=st.queued,
+                running=st.running,
+                succeeded=st.succeeded,
+                failed=st.failed,
+                blocked=st.blocked,
+            ).model_dump_json()
+        return self._last_batch_json
 
     async def wait(self) -> dict[str, list[TaskResult]]:
         """Wait for all Team Leads to complete. Returns results by service."""
         results: dict[str, list[TaskResult]] = {}
-        for name, task in self._tasks.items():
+        for lead, task in zip(self._leads, self._tasks):
+            name = lead.service_name
             try:
                 results[name] = await task
             except Exception:
                 logger.exception("Error waiting for Team Lead [%s]", name)
                 results[name] = []
+        await self._stop_broadcaster()
         return results
 
+    def get_lead(self, service_name: str) -> TeamLead | None:
+        idx = self._name_to_idx.get(service_name)
+        return None if idx is None else self._leads[idx]
+
     def pause_all(self) -> None:
-        for lead in self._leads.values():
+        for lead in self._leads:
             lead.pause()
         logger.info("All Team Leads paused")
 
     def resume_all(self) -> None:
-        for lead in self._leads.values():
+        for lead in self._leads:
             lead.resume()
         logger.info("All Team Leads resumed")
 
     def pause_service(self, service_name: str) -> bool:
-        lead = self._leads.get(service_name)
-        if lead:
-            lead.pause()
-            return True
-        return False
+        idx = self._name_to_idx.get(service_name)
+        if idx is None:
+            return False
+        self._leads[idx].pause()
+        return True
 
     def resume_service(self, service_name: str) -> bool:
-        lead = self._leads.get(service_name)
-        if lead:
-            lead.resume()
-            return True
-        return False
+        idx = self._name_to_idx.get(service_name)
+        if idx is None:
+            return False
+        self._leads[idx].resume()
+        return True
 
     async def shutdown(self) -> None:
         """Cancel all Team Leads and clean up."""
         self._shutdown = True
-        for lead in self._leads.values():
+        for lead in self._leads:
             lead.cancel()
-        for task in self._tasks.values():
+        for task in self._tasks:
             task.cancel()
+        await self._stop_broadcaster()
         logger.info("Orchestrator shut down for project %s", self.project_id)
 
     def get_status(self) -> dict[str, Any]:
         """Get current execution status."""
         services: dict[str, Any] = {}
-        for name, lead in self._leads.items():
-            services[name] = {
+        for lead in self._leads:
+            services[lead.service_name] = {
                 "current_task": lead.state.current_task,
                 "paused": lead.state.paused,
                 "completed": len(lead.state.completed),
@@ -201,25 +272,20 @@ class Orchestrator:
         Only creates Team Leads for services that still have pending tasks.
         Completed tasks are skipped. Counters are restored from the checkpoint.
         """
-        from mycroft.server.worker.execution_state import TaskStatus
-
         orch = cls(execution_state.project_id, execution_state=execution_state)
         orch.state.succeeded = execution_state.succeeded
 
-        for svc_name, svc_record in execution_state.services.items():
+        for svc_name in execution_state.services:
             # Build the task list from only pending tasks
-            pending_ids = execution_state.get_pending_task_ids(svc_name)
-            if not pending_ids:
+            pending = execution_state.get_pending_tasks(svc_name)
+            if not pending:
                 continue  # service fully completed, skip
 
-            tasks: list[dict[str, Any]] = []
-            for tid in pending_ids:
-                task_rec = execution_state.tasks[tid]
-                tasks.append({
-                    "id": task_rec.task_id,
-                    "title": task_rec.title,
-                    "description": "",  # description not stored in checkpoint
-                })
+            tasks: list[dict[str, Any]] = [
+                # description is not stored in the checkpoint
+                {"id": r.task_id, "title": r.title, "description": ""}
+                for r in pending
+            ]
 
             lead = TeamLead(
                 project_id=execution_state.project_id,
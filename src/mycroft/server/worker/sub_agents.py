@@ -1,27 +1,98 @@
 """Sub-agent runners — spawn Claude Agent SDK instances for code/test/QA work.
 
-Each sub-agent is a short-lived `query()` call with tailored context and tools.
+Each sub-agent run is one conversation with tailored context and tools, on a
+fresh SDK client so no history carries over between tasks.
 """
 
 from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from mycroft.server.settings import settings
 
+try:
+    from claude_agent_sdk import (
+        AssistantMessage,
+        ClaudeAgentOptions,
+        ClaudeSDKClient,
+        TextBlock,
+    )
+
+    _SDK_AVAILABLE = True
+except ImportError:
+    _SDK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SubAgentResult:
     success: bool
     output: str
     error: str = ""
 
 
+def _sdk_missing() -> SubAgentResult:
+    logger.warning("claude_agent_sdk not installed, returning mock result")
+    return SubAgentResult(
+        success=False,
+        output="",
+        error="claude_agent_sdk not installed",
+    )
+
+
+async def _run_session(options: Any, prompt: str) -> str:
+    """Run one conversation on its own SDK client and return the reply text."""
+    parts: list[str] = []
+    async with ClaudeSDKClient(options=options) as client:
+        await client.query(prompt)
+        async for message in client.receive_response():
+            if isinstance(message, AssistantMessage):
+                parts.extend(b.text for b in message.content if isinstance(b, TextBlock))
+    return "".join(parts)
+
+
+# System prompts only depend on the worktree and CLAUDE.md, which are the same
+# for every task a Team Lead runs, so each is built once and shared.
+@lru_cache(maxsize=64)
+def _code_writer_system(worktree_path: Path, claude_md: str) -> str:
+    return (
+        "You are a CodeWriter agent. Implement the task described below precisely.\n"
+        "Follow the C4 Level 4 design signatures exactly.\n"
+        "Use shared utilities — never duplicate code.\n"
+        "Run the linter before finishing.\n\n"
+        f"## Project Instructions (CLAUDE.md)\n{claude_md}\n\n"
+        f"## Working Directory\n{worktree_path}\n"
+    )
+
+
+@lru_cache(maxsize=64)
+def _unit_tester_system(worktree_path: Path, claude_md: str) -> str:
+    return (
+        "You are a UnitTester agent. Write comprehensive unit tests for the implementation.\n"
+        "Test both happy paths and error cases.\n"
+        "Mock external services — never call real APIs.\n"
+        "Run the full test suite before finishing.\n\n"
+        f"## Project Instructions (CLAUDE.md)\n{claude_md}\n\n"
+        f"## Working Directory\n{worktree_path}\n"
+    )
+
+
+@lru_cache(maxsize=64)
+def _qa_tester_system(worktree_path: Path) -> str:
+    return (
+        "You are a QATester agent. Validate the implementation against business specifications.\n"
+        "You do NOT have access to code or technical architecture.\n"
+        "Test from a USER perspective only.\n"
+        "Report results in business language.\n\n"
+        f"## Working Directory\n{worktree_path}\n"
+    )
+
+
 async def run_code_writer(
     worktree_path: Path,
     task_prompt: str,
@@ -35,36 +106,21 @@ async def run_code_writer(
     - CLAUDE.md (project conventions)
     - Full file system access to the worktree
     """
-    try:
-        from claude_agent_sdk import ClaudeAgentOptions, query
-
-        system = (
-            "You are a CodeWriter agent. Implement the task described below precisely.\n"
-            "Follow the C4 Level 4 design signatures exactly.\n"
-            "Use shared utilities — never duplicate code.\n"
-            "Run the linter before finishing.\n\n"
-            f"## Project Instructions (CLAUDE.md)\n{claude_md}\n\n"
-            f"## Working Directory\n{worktree_path}\n"
-        )
+    if not _SDK_AVAILABLE:
+        return _sdk_missing()
 
+    try:
         options = ClaudeAgentOptions(
             model=settings.claude_sdk_model,
-            system_prompt=system,
+            system_prompt=_code_writer_system(worktree_path, claude_md),
             max_turns=max_turns or settings.worker_max_turns,
             allowed_tools=["Read", "Write", "Edit", "Bash", "Glob", "Grep"],
             working_directory=str(worktree_path),
         )
 
-        result = await query(task_prompt, options=options)
-        return SubAgentResult(success=True, output=result.text)
+        output = await _run_session(options, task_prompt)
+        return SubAgentResult(success=True, output=output)
 
-    except ImportError:
-        logger.warning("claude_agent_sdk not installed, returning mock result")
-        return SubAgentResult(
-            success=False,
-            output="",
-            error="claude_agent_sdk not installed",
-        )
     except Exception as e:
         logger.exception("CodeWriter failed")
         return SubAgentResult(success=False, output="", error=str(e))
@@ -83,36 +139,21 @@ async def run_unit_tester(
     - Test patterns and conventions
     - File system access to the worktree
     """
-    try:
-        from claude_agent_sdk import ClaudeAgentOptions, query
-
-        system = (
-            "You are a UnitTester agent. Write comprehensive unit tests for the implementation.\n"
-            "Test both happy paths and error cases.\n"
-            "Mock external services — never call real APIs.\n"
-            "Run the full test suite before finishing.\n\n"
-            f"## Project Instructions (CLAUDE.md)\n{claude_md}\n\n"
-            f"## Working Directory\n{worktree_path}\n"
-        )
+    if not _SDK_AVAILABLE:
+        return _sdk_missing()
 
+    try:
         options = ClaudeAgentOptions(
             model=settings.claude_sdk_model,
-            system_prompt=system,
+            system_prompt=_unit_tester_system(worktree_path, claude_md),
             max_turns=max_turns or settings.worker_max_turns,
             allowed_tools=["Read", "Write", "Edit", "Bash", "Glob", "Grep"],
             working_directory=str(worktree_path),
         )
 
-        result = await query(task_prompt, options=options)
-        return SubAgentResult(success=True, output=result.text)
+        output = await _run_session(options, task_prompt)
+        return SubAgentResult(success=True, output=output)
 
-    except ImportError:
-        logger.warning("claude_agent_sdk not installed, returning mock result")
-        return SubAgentResult(
-            success=False,
-            output="",
-            error="claude_agent_sdk not installed",
-        )
     except Exception as e:
         logger.exception("UnitTester failed")
         return SubAgentResult(success=False, output="", error=str(e))
@@ -131,17 +172,10 @@ async def run_qa_tester(
     - Test commands to run
     - File system access (read-only intent, but can run tests)
     """
-    try:
-        from claude_agent_sdk import ClaudeAgentOptions, query
-
-        system = (
-            "You are a QATester agent. Validate the implementation against business specifications.\n"
-            "You do NOT have access to code or technical architecture.\n"
-            "Test from a USER perspective only.\n"
-            "Report results in business language.\n\n"
-            f"## Working Directory\n{worktree_path}\n"
-        )
+    if not _SDK_AVAILABLE:
+        return _sdk_missing()
 
+    try:
         prompt = (
             f"## Business Specifications\n{business_spec}\n\n"
             f"## Test Commands\nRun these to validate:\n"
@@ -151,22 +185,15 @@ async def run_qa_tester(
 
         options = ClaudeAgentOptions(
             model=settings.claude_sdk_model,
-            system_prompt=system,
+            system_prompt=_qa_tester_system(worktree_path),
             max_turns=max_turns or settings.worker_max_turns,
             allowed_tools=["Read", "Bash", "Glob", "Grep"],
             working_directory=str(worktree_path),
         )
 
-        result = await query(prompt, options=options)
-        return SubAgentResult(success=True, output=result.text)
+        output = await _run_session(options, prompt)
+        return SubAgentResult(success=True, output=output)
 
-    except ImportError:
-        logger.warning("claude_agent_sdk not installed, returning mock result")
-        return SubAgentResult(
-            success=False,
-            output="",
-            error="claude_agent_sdk not installed",
-        )
     except Exception as e:
         logger.exception("QATester failed")
         return SubAgentResult(success=False, output="", error=str(e))
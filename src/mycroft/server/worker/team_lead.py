@@ -27,7 +27,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     task_id: str
     task_title: str
@@ -39,7 +39,7 @@ class TaskResult:
     error: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamLeadState:
     service_name: str
     tasks: list[dict[str, Any]] = field(default_factory=list)
@@ -96,10 +96,11 @@ class TeamLead:
             if self.state.cancelled:
                 break
 
-            # Wait if paused
-            await self._pause_event.wait()
-            if self.state.cancelled:
-                break
+            # Wait if paused (skip the await in the common unpaused case)
+            if self.state.paused:
+                await self._pause_event.wait()
+                if self.state.cancelled:
+                    break
 
             task_id = task.get("id", "unknown")
             task_title = task.get("title", "Untitled")
@@ -191,7 +192,7 @@ class TeamLead:
                 error=f"UnitTester failed: {test_result.error}",
             )
 
-        # 3. QATester
+        # 3. QATester — runs after UnitTester, since both use the same worktree
         qa_result = await run_qa_tester(
             self.repo_path,
             self.business_spec,
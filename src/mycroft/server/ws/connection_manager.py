@@ -8,41 +8,73 @@ from typing import Any
 
 from fastapi import WebSocket
 
-from mycroft.shared.protocol import ServerMessage
+from mycroft.shared.protocol import PING_JSON, ServerMessage
 
 logger = logging.getLogger(__name__)
 
+HEARTBEAT_INTERVAL = 30  # seconds
+
 
 class ConnectionManager:
-    def __init__(self) -> None:
+    # No lock: each method touches the dict in a single step with no await
+    # in between, so they can't interleave on the event loop.
+
+    def __init__(self, heartbeat_interval: float = HEARTBEAT_INTERVAL) -> None:
         self._connections: dict[str, WebSocket] = {}  # project_id → websocket
-        self._lock = asyncio.Lock()
+        self.heartbeat_interval = heartbeat_interval
+        # One ping loop for all connections, running while any are open
+        self._heartbeat_task: asyncio.Task[None] | None = None
 
     async def connect(self, project_id: str, ws: WebSocket) -> None:
-        async with self._lock:
-            existing = self._connections.get(project_id)
-            if existing:
-                logger.warning("Replacing existing connection for project %s", project_id)
-                try:
-                    await existing.close(code=4001, reason="Replaced by new connection")
-                except Exception:
-                    pass
-            self._connections[project_id] = ws
-
-    async def disconnect(self, project_id: str) -> None:
-        async with self._lock:
+        existing = self._connections.get(project_id)
+        self._connections[project_id] = ws
+        ws.state.project_id = project_id
+        if self._heartbeat_task is None:
+            self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        if existing is not None and existing is not ws:
+            logger.warning("Replacing existing connection for project %s", project_id)
+            try:
+                await existing.close(code=4001, reason="Replaced by new connection")
+            except Exception:
+                pass
+
+    async def disconnect(self, project_id: str, ws: WebSocket | None = None) -> None:
+        """Forget the project's connection (only if it is still ``ws``, when given)."""
+        if ws is None or self._connections.get(project_id) is ws:
             self._connections.pop(project_id, None)
+        if not self._connections:
+            self._stop_heartbeat()
 
     async def send(self, project_id: str, message: ServerMessage) -> bool:
+        if project_id not in self._connections:
+            return False
+        return await self.send_raw(project_id, message.model_dump_json())
+
+    async def send_raw(self, project_id: str, payload: str) -> bool:
+        """Send an already-serialized JSON message."""
         ws = self._connections.get(project_id)
         if ws is None:
             return False
         try:
-            await ws.send_json(message.model_dump())
+            await ws.send_text(payload)
             return True
         except Exception:
             logger.exception("Failed to send message to project %s", project_id)
-            await self.disconnect(project_id)
+            await self.disconnect(project_id, ws)
+            return False
+
+    async def send_to_ws(self, ws: WebSocket, message: ServerMessage) -> bool:
+        """Reply on a connection the caller already holds, skipping the project lookup."""
+        return await self.send_raw_to_ws(ws, message.model_dump_json())
+
+    async def send_raw_to_ws(self, ws: WebSocket, payload: str) -> bool:
+        try:
+            await ws.send_text(payload)
+            return True
+        except Exception:
+            project_id = ws.state.project_id
+            logger.exception("Failed to send message to project %s", project_id)
+            await self.disconnect(project_id, ws)
             return False
 
     async def send_json(self, project_id: str, data: dict[str, Any]) -> bool:
@@ -54,11 +86,35 @@ class ConnectionManager:
             return True
         except Exception:
             logger.exception("Failed to send JSON to project %s", project_id)
-            await self.disconnect(project_id)
+            await self.disconnect(project_id, ws)
             return False
 
     def is_connected(self, project_id: str) -> bool:
         return project_id in self._connections
 
+    async def close(self) -> None:
+        """Stop the heartbeat (called on server shutdown)."""
+        task = self._heartbeat_task
+        self._stop_heartbeat()
+        if task is not None:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            # A failed ping is left to the connection's receive loop to notice
+            await asyncio.gather(
+                *(ws.send_text(PING_JSON) for ws in list(self._connections.values())),
+                return_exceptions=True,
+            )
+
+    def _stop_heartbeat(self) -> None:
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+
 
 manager = ConnectionManager()
@@ -12,13 +12,11 @@ from mycroft.shared.protocol import (
     AuthResult,
     ConfirmResponse,
     ErrorMessage,
-    PingMessage,
     StateSyncMessage,
     StepTransition,
     StepId,
-    StepState as ProtoStepState,
-    TurnComplete,
-    parse_client_message,
+    TURN_COMPLETE_JSON,
+    parse_client_json,
 )
 from mycroft.server.auth import validate_api_key
 from mycroft.server.ws.connection_manager import manager
@@ -30,8 +28,6 @@ from mycroft.server.agents.registry import get_agent
 
 logger = logging.getLogger(__name__)
 
-HEARTBEAT_INTERVAL = 30  # seconds
-
 
 async def websocket_endpoint(ws: WebSocket) -> None:
     await ws.accept()
@@ -39,19 +35,23 @@ async def websocket_endpoint(ws: WebSocket) -> None:
 
     try:
         # --- Auth phase ---
-        raw = await asyncio.wait_for(ws.receive_json(), timeout=30)
-        msg = parse_client_message(raw)
+        raw = await asyncio.wait_for(ws.receive_text(), timeout=30)
+        msg = parse_client_json(raw)
 
         if msg.type != "auth":
-            await ws.send_json(
-                AuthResult(success=False, error="First message must be auth").model_dump()
+            await ws.send_text(
+                AuthResult.model_construct(
+                    success=False, error="First message must be auth"
+                ).model_dump_json()
             )
             await ws.close(code=4000)
             return
 
         if not validate_api_key(msg.api_key):
-            await ws.send_json(
-                AuthResult(success=False, error="Invalid API key").model_dump()
+            await ws.send_text(
+                AuthResult.model_construct(
+                    success=False, error="Invalid API key"
+                ).model_dump_json()
             )
             await ws.close(code=4003)
             return
@@ -67,30 +67,18 @@ async def websocket_endpoint(ws: WebSocket) -> None:
         await manager.connect(project_id, ws)
 
         # Send auth result + state sync
-        await ws.send_json(
-            AuthResult(success=True, project_id=project_id).model_dump()
+        await ws.send_text(
+            AuthResult.model_construct(success=True, project_id=project_id).model_dump_json()
         )
         await _send_state_sync(ws, project)
 
         logger.info("Client authenticated for project %s", project_id)
 
-        # --- Message loop with heartbeat ---
-        async def _heartbeat() -> None:
-            while True:
-                await asyncio.sleep(HEARTBEAT_INTERVAL)
-                try:
-                    await ws.send_json(PingMessage().model_dump())
-                except Exception:
-                    break
-
-        heartbeat_task = asyncio.create_task(_heartbeat())
-        try:
-            while True:
-                raw = await ws.receive_json()
-                msg = parse_client_message(raw)
-                await _handle_message(ws, project, msg)
-        finally:
-            heartbeat_task.cancel()
+        # --- Message loop (pings come from the manager's shared heartbeat) ---
+        while True:
+            raw = await ws.receive_text()
+            msg = parse_client_json(raw)
+            await _handle_message(ws, project, msg)
 
     except WebSocketDisconnect:
         logger.info("Client disconnected from project %s", project_id)
@@ -100,14 +88,16 @@ async def websocket_endpoint(ws: WebSocket) -> None:
     except Exception:
         logger.exception("WebSocket error for project %s", project_id)
         try:
-            await ws.send_json(
-                ErrorMessage(message="Internal server error", recoverable=False).model_dump()
+            await ws.send_text(
+                ErrorMessage.model_construct(
+                    message="Internal server error", recoverable=False
+                ).model_dump_json()
             )
         except Exception:
             pass
     finally:
         if project_id:
-            await manager.disconnect(project_id)
+            await manager.disconnect(project_id, ws)
 
 
 async def _send_state_sync(ws: WebSocket, project: ProjectState) -> None:
@@ -117,20 +107,17 @@ async def _send_state_sync(ws: WebSocket, project: ProjectState) -> None:
     from mycroft.server.agents.tools.user_confirm import get_pending_confirm
     pending = get_pending_confirm(project.project_id)
 
-    steps = [
-        ProtoStepState(step_id=s.step_id, status=s.status)
-        for s in project.steps.values()
-    ]
-
-    sync = StateSyncMessage(
+    # Every field is server-side state that was validated when it was built,
+    # so skip re-validating the steps list and conversation tail.
+    sync = StateSyncMessage.model_construct(
         project_id=project.project_id,
         project_name=project.project_name,
         current_step=project.current_step,
-        steps=steps,
+        steps=project.sync_steps(),
         conversation_tail=tail,
         pending_confirm=pending,
     )
-    await ws.send_json(sync.model_dump())
+    await ws.send_text(sync.model_dump_json())
 
 
 async def _handle_message(ws: WebSocket, project: ProjectState, msg: Any) -> None:
@@ -141,7 +128,7 @@ async def _handle_message(ws: WebSocket, project: ProjectState, msg: Any) -> Non
     elif msg.type == "confirm_response":
         await _handle_confirm_response(project, msg)
     elif msg.type == "worker_command":
-        await _handle_worker_command(project, msg)
+        await _handle_worker_command(ws, project, msg)
     elif msg.type == "pong":
         pass  # heartbeat ack
 
@@ -158,12 +145,12 @@ async def _handle_user_message(ws: WebSocket, project: ProjectState, text: str)
         await agent.run(text)
     except Exception:
         logger.exception("Agent error in step %s", project.current_step.value)
-        await manager.send(
-            project.project_id,
-            ErrorMessage(message="Agent encountered an error. Please try again."),
+        await manager.send_to_ws(
+            ws,
+            ErrorMessage.model_construct(message="Agent encountered an error. Please try again."),
         )
 
-    await manager.send(project.project_id, TurnComplete())
+    await manager.send_raw_to_ws(ws, TURN_COMPLETE_JSON)
 
 
 async def _handle_command(
@@ -173,29 +160,27 @@ async def _handle_command(
         if name == "next":
             from_step = project.current_step
             new_step = pipeline.advance(project)
-            await manager.send(
-                project.project_id,
-                StepTransition(
+            await manager.send_to_ws(
+                ws,
+                StepTransition.model_construct(
                     from_step=from_step,
                     to_step=new_step,
                     to_status=project.steps[new_step].status,
                 ),
             )
-            # Re-send state sync after transition
-            project = ProjectState.load(project.project_id)
+            # Re-send state sync after transition (advance mutated project in place)
             await _send_state_sync(ws, project)
 
         elif name == "back":
             target = args.get("target")
             if not target:
-                await manager.send(
-                    project.project_id,
-                    ErrorMessage(message="Usage: /back <step_id>"),
+                await manager.send_to_ws(
+                    ws,
+                    ErrorMessage.model_construct(message="Usage: /back <step_id>"),
                 )
                 return
             target_step = StepId(target)
             new_step = pipeline.go_back(project, target_step)
-            project = ProjectState.load(project.project_id)
             await _send_state_sync(ws, project)
 
         elif name == "status":
@@ -212,14 +197,14 @@ async def _handle_command(
                 await _send_state_sync(ws, project)
 
         else:
-            await manager.send(
-                project.project_id,
-                ErrorMessage(message=f"Unknown command: {name}"),
+            await manager.send_to_ws(
+                ws,
+                ErrorMessage.model_construct(message=f"Unknown command: {name}"),
             )
     except PipelineError as e:
-        await manager.send(
-            project.project_id,
-            ErrorMessage(message=str(e)),
+        await manager.send_to_ws(
+            ws,
+            ErrorMessage.model_construct(message=str(e)),
         )
 
 
@@ -228,7 +213,7 @@ async def _handle_confirm_response(project: ProjectState, msg: ConfirmResponse)
     resolve_confirm(project.project_id, msg.confirm_id, msg.approved, msg.comment)
 
 
-async def _handle_worker_command(project: ProjectState, msg: Any) -> None:
+async def _handle_worker_command(ws: WebSocket, project: ProjectState, msg: Any) -> None:
     """Route worker commands to the orchestrator (if active)."""
     from mycroft.server.agents.execution_dashboard import get_orchestrator
 
@@ -237,9 +222,9 @@ async def _handle_worker_command(project: ProjectState, msg: Any) -> None:
 
     orchestrator = get_orchestrator(project.project_id)
     if orchestrator is None:
-        await manager.send(
-            project.project_id,
-            ErrorMessage(message="No active execution for this project."),
+        await manager.send_to_ws(
+            ws,
+            ErrorMessage.model_construct(message="No active execution for this project."),
         )
         return
 
@@ -249,50 +234,38 @@ async def _handle_worker_command(project: ProjectState, msg: Any) -> None:
         orchestrator.resume_all()
     elif action == "pause_service":
         if not msg.service_name:
-            await manager.send(
-                project.project_id,
-                ErrorMessage(message="pause_service requires a service_name."),
+            await manager.send_to_ws(
+                ws,
+                ErrorMessage.model_construct(message="pause_service requires a service_name."),
             )
             return
         if not orchestrator.pause_service(msg.service_name):
-            await manager.send(
-                project.project_id,
-                ErrorMessage(message=f"Service '{msg.service_name}' not found."),
+            await manager.send_to_ws(
+                ws,
+                ErrorMessage.model_construct(message=f"Service '{msg.service_name}' not found."),
             )
             return
     elif action == "resume_service":
         if not msg.service_name:
-            await manager.send(
-                project.project_id,
-                ErrorMessage(message="resume_service requires a service_name."),
+            await manager.send_to_ws(
+                ws,
+                ErrorMessage.model_construct(message="resume_service requires a service_name."),
             )
             return
         if not orchestrator.resume_service(msg.service_name):
-            await manager.send(
-                project.project_id,
-                ErrorMessage(message=f"Service '{msg.service_name}' not found."),
+            await manager.send_to_ws(
+                ws,
+                ErrorMessage.model_construct(message=f"Service '{msg.service_name}' not found."),
             )
             return
     elif action == "cancel":
         await orchestrator.shutdown()
     else:
-        await manager.send(
-            project.project_id,
-            ErrorMessage(message=f"Unknown worker action: {action}"),
+        await manager.send_to_ws(
+            ws,
+            ErrorMessage.model_construct(message=f"Unknown worker action: {action}"),
         )
         return
 
     # Send batch status after each successful action
-    from mycroft.shared.protocol import WorkerBatchUpdate
-
-    await manager.send(
-        project.project_id,
-        WorkerBatchUpdate(
-            total_tasks=orchestrator.state.total_tasks,
-            queued=orchestrator.state.queued,
-            running=orchestrator.state.running,
-            succeeded=orchestrator.state.succeeded,
-            failed=orchestrator.state.failed,
-            blocked=orchestrator.state.blocked,
-        ),
-    )
+    await manager.send_raw_to_ws(ws, orchestrator.batch_update_json())
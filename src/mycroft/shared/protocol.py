@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import enum
-from typing import Any, Literal
+import json
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 
 # --- Enums ---
@@ -90,18 +91,22 @@ ClientMessage = (
 
 
 def parse_client_message(data: dict[str, Any]) -> ClientMessage:
-    type_map: dict[str, type[BaseModel]] = {
-        "auth": AuthMessage,
-        "message": UserMessage,
-        "command": CommandMessage,
-        "confirm_response": ConfirmResponse,
-        "pong": PongMessage,
-        "worker_command": WorkerCommand,
-    }
-    msg_type = data.get("type")
-    if msg_type not in type_map:
-        raise ValueError(f"Unknown client message type: {msg_type}")
-    return type_map[msg_type].model_validate(data)
+    try:
+        return _client_adapter.validate_python(data)
+    except ValidationError as e:
+        if _is_unknown_tag(e):
+            raise ValueError(f"Unknown client message type: {data.get('type')}") from None
+        raise
+
+
+def parse_client_json(data: str | bytes) -> ClientMessage:
+    """Decode and validate a raw JSON frame in one pass (no intermediate dict)."""
+    try:
+        return _client_adapter.validate_json(data)
+    except ValidationError as e:
+        if _is_unknown_tag(e):
+            raise ValueError(f"Unknown client message type: {_error_tag(e)}") from None
+        raise
 
 
 # --- Server → Client messages ---
@@ -177,18 +182,37 @@ class ErrorMessage(BaseModel):
     recoverable: bool = True
 
 
+WorkerStatus = Literal["queued", "running", "pr_opened", "succeeded", "failed", "retrying"]
+
+
 class WorkerStatusUpdate(BaseModel):
     type: Literal["worker_status"] = "worker_status"
     task_id: str
     task_title: str
     service_name: str
     worker_id: str
-    status: Literal["queued", "running", "pr_opened", "succeeded", "failed", "retrying"]
+    status: WorkerStatus
     pr_url: str | None = None
     error: str | None = None
     progress: str = ""
 
 
+class WorkerStatusBatch(BaseModel):
+    """Status changes for several tasks of one service, as parallel lists.
+
+    Entry ``i`` of each list describes the same task.
+    """
+
+    type: Literal["worker_status_batch"] = "worker_status_batch"
+    service_name: str
+    worker_id: str
+    task_ids: list[str]
+    task_titles: list[str]
+    statuses: list[WorkerStatus]
+    pr_urls: list[str | None]
+    errors: list[str | None]
+
+
 class WorkerBatchUpdate(BaseModel):
     type: Literal["worker_batch"] = "worker_batch"
     total_tasks: int
@@ -221,29 +245,69 @@ ServerMessage = (
     | PingMessage
     | ErrorMessage
     | WorkerStatusUpdate
+    | WorkerStatusBatch
     | WorkerBatchUpdate
     | BlockerNotification
 )
 
 
+# Messages without instance data: one shared instance each, serialized once.
+PONG = PongMessage.model_construct()
+PING = PingMessage.model_construct()
+TURN_COMPLETE = TurnComplete.model_construct()
+TEXT_BLOCK_START = TextBlockStart.model_construct()
+TEXT_BLOCK_END = TextBlockEnd.model_construct()
+
+PONG_JSON = PONG.model_dump_json()
+PING_JSON = PING.model_dump_json()
+TURN_COMPLETE_JSON = TURN_COMPLETE.model_dump_json()
+TEXT_BLOCK_START_JSON = TEXT_BLOCK_START.model_dump_json()
+TEXT_BLOCK_END_JSON = TEXT_BLOCK_END.model_dump_json()
+
+_encode_str = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def encode_text_delta(delta: str) -> str:
+    """Serialize a TextDelta without building the model (sent per streamed chunk).
+
+    Produces the same JSON as ``TextDelta(delta=delta).model_dump_json()``.
+    """
+    return '{"type":"text_delta","delta":' + _encode_str(delta) + "}"
+
+
 def parse_server_message(data: dict[str, Any]) -> ServerMessage:
-    type_map: dict[str, type[BaseModel]] = {
-        "auth_result": AuthResult,
-        "state_sync": StateSyncMessage,
-        "text_delta": TextDelta,
-        "text_block_start": TextBlockStart,
-        "text_block_end": TextBlockEnd,
-        "tool_activity": ToolActivity,
-        "confirm_request": ConfirmRequest,
-        "turn_complete": TurnComplete,
-        "step_transition": StepTransition,
-        "ping": PingMessage,
-        "error": ErrorMessage,
-        "worker_status": WorkerStatusUpdate,
-        "worker_batch": WorkerBatchUpdate,
-        "blocker_notification": BlockerNotification,
-    }
-    msg_type = data.get("type")
-    if msg_type not in type_map:
-        raise ValueError(f"Unknown server message type: {msg_type}")
-    return type_map[msg_type].model_validate(data)
+    try:
+        return _server_adapter.validate_python(data)
+    except ValidationError as e:
+        if _is_unknown_tag(e):
+            raise ValueError(f"Unknown server message type: {data.get('type')}") from None
+        raise
+
+
+def parse_server_json(data: str | bytes) -> ServerMessage:
+    """Decode and validate a raw JSON frame in one pass (no intermediate dict)."""
+    try:
+        return _server_adapter.validate_json(data)
+    except ValidationError as e:
+        if _is_unknown_tag(e):
+            raise ValueError(f"Unknown server message type: {_error_tag(e)}") from None
+        raise
+
+
+# Messages are dispatched on their "type" tag by pydantic-core.
+_client_adapter: TypeAdapter[ClientMessage] = TypeAdapter(
+    Annotated[ClientMessage, Field(discriminator="type")]
+)
+_server_adapter: TypeAdapter[ServerMessage] = TypeAdapter(
+    Annotated[ServerMessage, Field(discriminator="type")]
+)
+
+
+def _is_unknown_tag(e: ValidationError) -> bool:
+    """True if validation failed because "type" is missing or not recognised."""
+    return e.errors()[0]["type"] in ("union_tag_invalid", "union_tag_not_found")
+
+
+def _error_tag(e: ValidationError) -> Any:
+    """The unrecognised "type" value from a tag error (None if it was missing)."""
+    return e.errors()[0].get("ctx", {}).get("tag")
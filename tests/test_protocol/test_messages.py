@@ -1,5 +1,7 @@
 """Tests for WebSocket protocol message types."""
 
+import json
+
 import pytest
 
 from mycroft.shared.protocol import (
@@ -15,6 +17,7 @@ from mycroft.shared.protocol import (
     ConfirmRequest,
     ErrorMessage,
     StepTransition,
+    WorkerStatusBatch,
     WorkerStatusUpdate,
     WorkerBatchUpdate,
     BlockerNotification,
@@ -22,7 +25,15 @@ from mycroft.shared.protocol import (
     StepStatus,
     StepState,
     STEP_ORDER,
+    PING_JSON,
+    PONG_JSON,
+    TEXT_BLOCK_END_JSON,
+    TEXT_BLOCK_START_JSON,
+    TURN_COMPLETE_JSON,
+    encode_text_delta,
+    parse_client_json,
     parse_client_message,
+    parse_server_json,
     parse_server_message,
 )
 
@@ -103,6 +114,12 @@ class TestParseClientMessage:
         with pytest.raises(ValueError, match="Unknown client message type"):
             parse_client_message({"foo": "bar"})
 
+    def test_invalid_fields_raise_validation_error(self):
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            parse_client_message({"type": "auth"})  # missing api_key
+
 
 class TestParseServerMessage:
     def test_auth_result_success(self):
@@ -168,6 +185,40 @@ class TestParseServerMessage:
             parse_server_message({"type": "bogus"})
 
 
+class TestParseJson:
+    def test_client_frame(self):
+        msg = parse_client_json('{"type": "message", "text": "hello"}')
+        assert isinstance(msg, UserMessage)
+        assert msg.text == "hello"
+
+    def test_client_bytes(self):
+        assert isinstance(parse_client_json(b'{"type": "pong"}'), PongMessage)
+
+    def test_client_unknown_type_raises(self):
+        with pytest.raises(ValueError, match="Unknown client message type: bogus"):
+            parse_client_json('{"type": "bogus"}')
+
+    def test_server_frame_roundtrip(self):
+        original = ErrorMessage(message="fail", recoverable=False)
+        assert parse_server_json(original.model_dump_json()) == original
+
+    def test_server_unknown_type_raises(self):
+        with pytest.raises(ValueError, match="Unknown server message type"):
+            parse_server_json("{}")
+
+
+class TestEncodeTextDelta:
+    @pytest.mark.parametrize("delta", [
+        "hello",
+        "",
+        'say "hi"\n\ttab \\ slash',
+        "naïve — 日本語 🚀",
+        "\x00\x1f control",
+    ])
+    def test_matches_model_dump_json(self, delta):
+        assert encode_text_delta(delta) == TextDelta(delta=delta).model_dump_json()
+
+
 class TestMessageRoundtrip:
     def test_auth_roundtrip(self):
         original = AuthMessage(api_key="key", project_id="p1")
@@ -181,6 +232,18 @@ class TestMessageRoundtrip:
         parsed = parse_server_message(data)
         assert parsed == original
 
+    def test_pong_constant(self):
+        assert isinstance(parse_client_json(PONG_JSON), PongMessage)
+
+    @pytest.mark.parametrize("payload, type_", [
+        (PING_JSON, "ping"),
+        (TURN_COMPLETE_JSON, "turn_complete"),
+        (TEXT_BLOCK_START_JSON, "text_block_start"),
+        (TEXT_BLOCK_END_JSON, "text_block_end"),
+    ])
+    def test_constant_messages(self, payload, type_):
+        assert parse_server_message(json.loads(payload)).type == type_
+
 
 class TestWorkerCommand:
     def test_parse(self):
@@ -237,6 +300,21 @@ class TestWorkerStatusUpdate:
         assert msg.pr_url == "https://github.com/org/repo/pull/1"
 
 
+class TestWorkerStatusBatch:
+    def test_roundtrip(self):
+        original = WorkerStatusBatch(
+            service_name="auth",
+            worker_id="auth",
+            task_ids=["t1", "t2"],
+            task_titles=["Model", "Login"],
+            statuses=["succeeded", "failed"],
+            pr_urls=["https://github.com/o/r/pull/1", None],
+            errors=[None, "tests failed"],
+        )
+        parsed = parse_server_message(original.model_dump())
+        assert parsed == original
+
+
 class TestWorkerBatchUpdate:
     def test_parse(self):
         msg = parse_server_message(
@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+from unittest.mock import AsyncMock
 
 import pytest
 
+from mycroft.server.linear.models import LinearIssue
 from mycroft.server.worker.blocker import (
     PendingBlocker,
     cleanup_blocker,
     clear_all_blockers,
+    close_linear,
     create_blocker,
     get_blocker,
+    get_linear_client,
     get_pending_blockers,
     resolve_blocker,
     resolve_blocker_by_linear_issue,
@@ -23,24 +27,26 @@ from mycroft.server.worker.execution_state import (
 )
 
 
+@pytest.fixture(autouse=True, scope="module")
+def _offline():
+    """Linear disabled and client sends stubbed for every test in the module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("mycroft.server.worker.blocker.settings.linear_api_key", "")
+        mp.setattr("mycroft.server.worker.blocker.manager.send_raw", _mock_send)
+        yield
+
+
 @pytest.fixture(autouse=True)
-def _cleanup():
+async def _cleanup():
     clear_all_blockers()
     yield
     clear_all_blockers()
+    await close_linear()
 
 
 class TestCreateBlocker:
     @pytest.mark.asyncio
-    async def test_creates_blocker(self, monkeypatch):
-        # Disable Linear integration for unit test
-        monkeypatch.setattr("mycroft.server.worker.blocker.settings.linear_api_key", "")
-        # Mock manager.send to not require real WS
-        monkeypatch.setattr(
-            "mycroft.server.worker.blocker.manager.send",
-            _mock_send,
-        )
-
+    async def test_creates_blocker(self):
         blocker = await create_blocker("proj1", "auth", "Which OAuth provider?")
         assert isinstance(blocker, PendingBlocker)
         assert blocker.service_name == "auth"
@@ -48,18 +54,12 @@ class TestCreateBlocker:
         assert not blocker.event.is_set()
 
     @pytest.mark.asyncio
-    async def test_blocker_is_retrievable(self, monkeypatch):
-        monkeypatch.setattr("mycroft.server.worker.blocker.settings.linear_api_key", "")
-        monkeypatch.setattr("mycroft.server.worker.blocker.manager.send", _mock_send)
-
+    async def test_blocker_is_retrievable(self):
         blocker = await create_blocker("proj1", "auth", "question")
         assert get_blocker(blocker.blocker_id) is blocker
 
     @pytest.mark.asyncio
-    async def test_multiple_blockers(self, monkeypatch):
-        monkeypatch.setattr("mycroft.server.worker.blocker.settings.linear_api_key", "")
-        monkeypatch.setattr("mycroft.server.worker.blocker.manager.send", _mock_send)
-
+    async def test_multiple_blockers(self):
         b1 = await create_blocker("proj1", "auth", "q1")
         b2 = await create_blocker("proj1", "api", "q2")
         pending = get_pending_blockers()
@@ -67,13 +67,19 @@ class TestCreateBlocker:
         assert b1.blocker_id in pending
         assert b2.blocker_id in pending
 
+    @pytest.mark.asyncio
+    async def test_blocker_ids_are_unique(self):
+        ids = {(await create_blocker("proj1", "auth", f"q{i}")).blocker_id for i in range(20)}
+        assert len(ids) == 20
+
+    def test_pending_blockers_view_is_read_only(self):
+        with pytest.raises(TypeError):
+            get_pending_blockers()["b1"] = None  # type: ignore[index]
+
 
 class TestResolveBlocker:
     @pytest.mark.asyncio
-    async def test_resolve_sets_event(self, monkeypatch):
-        monkeypatch.setattr("mycroft.server.worker.blocker.settings.linear_api_key", "")
-        monkeypatch.setattr("mycroft.server.worker.blocker.manager.send", _mock_send)
-
+    async def test_resolve_sets_event(self):
         blocker = await create_blocker("proj1", "auth", "which provider?")
         assert not blocker.event.is_set()
 
@@ -87,26 +93,75 @@ class TestResolveBlocker:
 
     @pytest.mark.asyncio
     async def test_resolve_by_linear_issue(self, monkeypatch):
-        monkeypatch.setattr("mycroft.server.worker.blocker.settings.linear_api_key", "")
-        monkeypatch.setattr("mycroft.server.worker.blocker.manager.send", _mock_send)
+        monkeypatch.setattr("mycroft.server.worker.blocker.settings.linear_api_key", "key")
+        monkeypatch.setattr("mycroft.server.worker.blocker.settings.linear_team_id", "team")
+        monkeypatch.setattr(
+            "mycroft.server.worker.blocker.LinearClient.create_issue",
+            AsyncMock(return_value=LinearIssue(id="linear-123", identifier="ABC-1")),
+        )
 
         blocker = await create_blocker("proj1", "auth", "question")
-        blocker.linear_issue_id = "linear-123"
+        assert blocker.linear_issue_id == "linear-123"
 
         result = resolve_blocker_by_linear_issue("linear-123", "the answer")
         assert result is True
         assert blocker.answer == "the answer"
 
+    def test_resolve_by_linear_issue_after_restore(self):
+        exec_state = ExecutionState(project_id="proj1")
+        exec_state.blockers = {
+            "b1": BlockerRecord(
+                blocker_id="b1", service_name="auth", question="q", linear_issue_id="lin-1"
+            ),
+        }
+        restore_blockers_from_state(exec_state)
+
+        assert resolve_blocker_by_linear_issue("lin-1", "answer") is True
+        assert get_blocker("b1").answer == "answer"
+
+    @pytest.mark.asyncio
+    async def test_cleanup_removes_linear_index(self, monkeypatch):
+        exec_state = ExecutionState(project_id="proj1")
+        exec_state.blockers = {
+            "b1": BlockerRecord(
+                blocker_id="b1", service_name="auth", question="q", linear_issue_id="lin-1"
+            ),
+        }
+        restore_blockers_from_state(exec_state)
+        cleanup_blocker("b1")
+
+        assert resolve_blocker_by_linear_issue("lin-1", "answer") is False
+
     def test_resolve_by_linear_issue_not_found(self):
         assert resolve_blocker_by_linear_issue("missing", "answer") is False
 
 
-class TestCleanupBlocker:
+class TestSharedLinearClient:
     @pytest.mark.asyncio
-    async def test_cleanup(self, monkeypatch):
-        monkeypatch.setattr("mycroft.server.worker.blocker.settings.linear_api_key", "")
-        monkeypatch.setattr("mycroft.server.worker.blocker.manager.send", _mock_send)
+    async def test_blockers_share_one_client(self, monkeypatch):
+        monkeypatch.setattr("mycroft.server.worker.blocker.settings.linear_api_key", "key")
+        monkeypatch.setattr("mycroft.server.worker.blocker.settings.linear_team_id", "team")
+        monkeypatch.setattr(
+            "mycroft.server.worker.blocker.LinearClient.create_issue",
+            AsyncMock(return_value=LinearIssue(id="linear-1", identifier="ABC-1")),
+        )
+
+        client = get_linear_client()
+        await create_blocker("proj1", "auth", "q1")
+        await create_blocker("proj1", "billing", "q2")
+
+        assert get_linear_client() is client
+
+    @pytest.mark.asyncio
+    async def test_close_linear_resets_client(self):
+        client = get_linear_client()
+        await close_linear()
+        assert get_linear_client() is not client
 
+
+class TestCleanupBlocker:
+    @pytest.mark.asyncio
+    async def test_cleanup(self):
         blocker = await create_blocker("proj1", "auth", "q")
         assert get_blocker(blocker.blocker_id) is not None
         cleanup_blocker(blocker.blocker_id)
@@ -115,11 +170,8 @@ class TestCleanupBlocker:
 
 class TestBlockerWaitPattern:
     @pytest.mark.asyncio
-    async def test_wait_and_resolve(self, monkeypatch):
+    async def test_wait_and_resolve(self):
         """Simulate the real pattern: create blocker, wait in background, resolve."""
-        monkeypatch.setattr("mycroft.server.worker.blocker.settings.linear_api_key", "")
-        monkeypatch.setattr("mycroft.server.worker.blocker.manager.send", _mock_send)
-
         blocker = await create_blocker("proj1", "auth", "question")
 
         async def _wait_for_answer():
@@ -127,7 +179,7 @@ class TestBlockerWaitPattern:
             return blocker.answer
 
         async def _resolve_after_delay():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
             resolve_blocker(blocker.blocker_id, "the answer")
 
         # Run both concurrently
@@ -149,8 +201,6 @@ async def _mock_send(*args, **kwargs):
 class TestBlockerWithExecutionState:
     @pytest.mark.asyncio
     async def test_create_blocker_checkpoints(self, monkeypatch, tmp_path):
-        monkeypatch.setattr("mycroft.server.worker.blocker.settings.linear_api_key", "")
-        monkeypatch.setattr("mycroft.server.worker.blocker.manager.send", _mock_send)
         monkeypatch.setattr(
             "mycroft.server.worker.execution_state.settings.data_dir", tmp_path
         )
@@ -168,8 +218,6 @@ class TestBlockerWithExecutionState:
 
     @pytest.mark.asyncio
     async def test_resolve_blocker_checkpoints(self, monkeypatch, tmp_path):
-        monkeypatch.setattr("mycroft.server.worker.blocker.settings.linear_api_key", "")
-        monkeypatch.setattr("mycroft.server.worker.blocker.manager.send", _mock_send)
         monkeypatch.setattr(
             "mycroft.server.worker.execution_state.settings.data_dir", tmp_path
         )
@@ -1,51 +1,79 @@
 """Tests for WebSocket connection manager."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
 
 import pytest
 
 from mycroft.server.ws.connection_manager import ConnectionManager
-from mycroft.shared.protocol import ErrorMessage
+from mycroft.shared.protocol import PING_JSON, ErrorMessage
 
 
 @pytest.fixture
-def mgr():
-    return ConnectionManager()
+async def mgr():
+    m = ConnectionManager()
+    yield m
+    await m.close()
 
 
-def make_mock_ws():
-    ws = AsyncMock()
-    ws.send_json = AsyncMock()
-    ws.close = AsyncMock()
-    return ws
+class _FakeWS:
+    """Just the parts of a Starlette WebSocket the manager touches."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.sent: list[str] = []
+        self.closed = False
+        self.fail = fail
+        self.state = SimpleNamespace()
+
+    async def send_text(self, data: str) -> None:
+        if self.fail:
+            raise RuntimeError("connection lost")
+        self.sent.append(data)
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def ws_factory():
+    return _FakeWS
 
 
 class TestConnect:
     @pytest.mark.asyncio
-    async def test_connect(self, mgr):
-        ws = make_mock_ws()
+    async def test_connect(self, mgr, ws_factory):
+        ws = ws_factory()
         await mgr.connect("p1", ws)
         assert mgr.is_connected("p1")
 
     @pytest.mark.asyncio
-    async def test_replace_existing(self, mgr):
-        ws1 = make_mock_ws()
-        ws2 = make_mock_ws()
+    async def test_replace_existing(self, mgr, ws_factory):
+        ws1 = ws_factory()
+        ws2 = ws_factory()
         await mgr.connect("p1", ws1)
         await mgr.connect("p1", ws2)
-        ws1.close.assert_called_once()
+        assert ws1.closed
         assert mgr.is_connected("p1")
 
 
 class TestDisconnect:
     @pytest.mark.asyncio
-    async def test_disconnect(self, mgr):
-        ws = make_mock_ws()
+    async def test_disconnect(self, mgr, ws_factory):
+        ws = ws_factory()
         await mgr.connect("p1", ws)
         await mgr.disconnect("p1")
         assert not mgr.is_connected("p1")
 
+    @pytest.mark.asyncio
+    async def test_stale_disconnect_keeps_replacement(self, mgr, ws_factory):
+        ws1 = ws_factory()
+        ws2 = ws_factory()
+        await mgr.connect("p1", ws1)
+        await mgr.connect("p1", ws2)
+        # The replaced connection's handler cleaning up must not drop ws2
+        await mgr.disconnect("p1", ws1)
+        assert mgr.is_connected("p1")
+
     @pytest.mark.asyncio
     async def test_disconnect_nonexistent(self, mgr):
         # Should not raise
@@ -54,13 +82,13 @@ class TestDisconnect:
 
 class TestSend:
     @pytest.mark.asyncio
-    async def test_send_success(self, mgr):
-        ws = make_mock_ws()
+    async def test_send_success(self, mgr, ws_factory):
+        ws = ws_factory()
         await mgr.connect("p1", ws)
         msg = ErrorMessage(message="test")
         result = await mgr.send("p1", msg)
         assert result is True
-        ws.send_json.assert_called_once()
+        assert ws.sent == [msg.model_dump_json()]
 
     @pytest.mark.asyncio
     async def test_send_no_connection(self, mgr):
@@ -69,9 +97,8 @@ class TestSend:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_send_failure_disconnects(self, mgr):
-        ws = make_mock_ws()
-        ws.send_json.side_effect = RuntimeError("connection lost")
+    async def test_send_failure_disconnects(self, mgr, ws_factory):
+        ws = ws_factory(fail=True)
         await mgr.connect("p1", ws)
         msg = ErrorMessage(message="test")
         result = await mgr.send("p1", msg)
@@ -79,13 +106,88 @@ class TestSend:
         assert not mgr.is_connected("p1")
 
 
+class TestSendRaw:
+    @pytest.mark.asyncio
+    async def test_send_raw_passes_payload_through(self, mgr, ws_factory):
+        ws = ws_factory()
+        await mgr.connect("p1", ws)
+        payload = ErrorMessage(message="test").model_dump_json()
+        assert await mgr.send_raw("p1", payload) is True
+        assert ws.sent == [payload]
+
+    @pytest.mark.asyncio
+    async def test_send_raw_no_connection(self, mgr):
+        assert await mgr.send_raw("p1", "{}") is False
+
+
+class TestSendToWs:
+    @pytest.mark.asyncio
+    async def test_sends_on_given_connection(self, mgr, ws_factory):
+        ws = ws_factory()
+        await mgr.connect("p1", ws)
+        msg = ErrorMessage(message="test")
+        assert await mgr.send_to_ws(ws, msg) is True
+        assert ws.sent == [msg.model_dump_json()]
+
+    @pytest.mark.asyncio
+    async def test_failure_disconnects_project(self, mgr, ws_factory):
+        ws = ws_factory(fail=True)
+        await mgr.connect("p1", ws)
+        assert await mgr.send_raw_to_ws(ws, "{}") is False
+        assert not mgr.is_connected("p1")
+
+
 class TestIsConnected:
     @pytest.mark.asyncio
     async def test_not_connected(self, mgr):
         assert not mgr.is_connected("p1")
 
     @pytest.mark.asyncio
-    async def test_connected(self, mgr):
-        ws = make_mock_ws()
+    async def test_connected(self, mgr, ws_factory):
+        ws = ws_factory()
         await mgr.connect("p1", ws)
         assert mgr.is_connected("p1")
+
+
+async def _step_loop(times: int = 10) -> None:
+    """Let other tasks run for a fixed number of loop iterations."""
+    for _ in range(times):
+        await asyncio.sleep(0)
+
+
+class TestHeartbeat:
+    # A zero interval makes each heartbeat round a fixed number of loop
+    # iterations, so the tests step the loop instead of waiting on the clock.
+
+    @pytest.mark.asyncio
+    async def test_one_heartbeat_pings_every_connection(self, mgr, ws_factory):
+        mgr.heartbeat_interval = 0
+        ws1, ws2 = ws_factory(), ws_factory()
+        await mgr.connect("p1", ws1)
+        task = mgr._heartbeat_task
+        await mgr.connect("p2", ws2)
+        assert mgr._heartbeat_task is task
+
+        await _step_loop()
+        assert ws1.sent[-1] == PING_JSON
+        assert ws2.sent[-1] == PING_JSON
+
+    @pytest.mark.asyncio
+    async def test_failed_ping_does_not_stop_others(self, mgr, ws_factory):
+        mgr.heartbeat_interval = 0
+        ws1, ws2 = ws_factory(fail=True), ws_factory()
+        await mgr.connect("p1", ws1)
+        await mgr.connect("p2", ws2)
+
+        await _step_loop()
+        assert len(ws2.sent) >= 2
+
+    @pytest.mark.asyncio
+    async def test_stops_when_last_connection_leaves(self, mgr, ws_factory):
+        ws = ws_factory()
+        await mgr.connect("p1", ws)
+        task = mgr._heartbeat_task
+        await mgr.disconnect("p1", ws)
+        await asyncio.sleep(0)
+        assert mgr._heartbeat_task is None
+        assert task.cancelled()
@@ -1,5 +1,7 @@
 """Tests for conversation JSONL persistence."""
 
+import pytest
+
 from mycroft.shared.protocol import StepId
 from mycroft.server.state.conversation import (
     append_message,
@@ -7,6 +9,7 @@ from mycroft.server.state.conversation import (
     delete_conversation,
     tail_messages,
 )
+from mycroft.server.state.persistence import flush_jsonl
 
 
 class TestConversation:
@@ -16,11 +19,15 @@ class TestConversation:
         assert len(msgs) == 1
         assert msgs[0]["role"] == "user"
 
-    def test_append_multiple(self, tmp_path):
+    # Appends inside a running loop are buffered in memory, so these loops
+    # cost one file write at the flush instead of one per message.
+    @pytest.mark.asyncio
+    async def test_append_multiple(self, tmp_path):
         for i in range(5):
             append_message(tmp_path, StepId.IDEA_SCOPING, {"role": "user", "content": f"msg {i}"})
-        msgs = load_messages(tmp_path, StepId.IDEA_SCOPING)
-        assert len(msgs) == 5
+        assert len(load_messages(tmp_path, StepId.IDEA_SCOPING)) == 5
+        flush_jsonl()
+        assert len(load_messages(tmp_path, StepId.IDEA_SCOPING)) == 5
 
     def test_load_empty(self, tmp_path):
         msgs = load_messages(tmp_path, StepId.IDEA_SCOPING)
@@ -47,9 +54,11 @@ class TestConversation:
         tail = tail_messages(tmp_path, StepId.IDEA_SCOPING, count=10)
         assert len(tail) == 3
 
-    def test_tail_more_than_count(self, tmp_path):
+    @pytest.mark.asyncio
+    async def test_tail_more_than_count(self, tmp_path):
         for i in range(50):
             append_message(tmp_path, StepId.IDEA_SCOPING, {"n": i})
+        flush_jsonl()
         tail = tail_messages(tmp_path, StepId.IDEA_SCOPING, count=5)
         assert len(tail) == 5
         assert tail[0]["n"] == 45
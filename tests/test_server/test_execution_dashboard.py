@@ -13,9 +13,33 @@ from mycroft.server.agents.execution_dashboard import (
     extract_service_name,
     get_orchestrator,
 )
+from mycroft.server.linear.models import LinearIssue
 from mycroft.server.worker.execution_state import ExecutionState, ServiceRecord, TaskRecord
 from mycroft.server.worker.orchestrator import Orchestrator
 
+_MOCK_LINEAR_ISSUES = [
+    # Story 1 (no parent)
+    LinearIssue(id="s1", identifier="ABC-1", title="[Auth] Authentication Service"),
+    # Story 2
+    LinearIssue(id="s2", identifier="ABC-2", title="[Payments] Payment Service"),
+    # Tasks under story 1
+    LinearIssue(id="t1", identifier="ABC-3", title="Implement login", parent_id="s1"),
+    LinearIssue(id="t2", identifier="ABC-4", title="Add JWT validation", parent_id="s1"),
+    # Task under story 2
+    LinearIssue(id="t3", identifier="ABC-5", title="Stripe integration", parent_id="s2"),
+]
+
+
+@pytest.fixture
+def mock_manager(monkeypatch):
+    """Stand-in for the connection manager, with awaitable send methods."""
+    m = MagicMock()
+    m.send = AsyncMock()
+    m.send_raw = AsyncMock()
+    m.send_json = AsyncMock()
+    monkeypatch.setattr("mycroft.server.agents.execution_dashboard.manager", m)
+    return m
+
 
 @pytest.fixture(autouse=True)
 def _cleanup():
@@ -76,25 +100,24 @@ def _make_agent() -> ExecutionDashboardAgent:
 
 class TestDashboardPause:
     @pytest.mark.asyncio
-    async def test_pause_calls_orchestrator(self):
+    async def test_pause_calls_orchestrator(self, mock_manager):
         agent = _make_agent()
         orch = MagicMock(spec=Orchestrator)
         orch.state = MagicMock(total_tasks=5, queued=2, running=1, succeeded=1, failed=0, blocked=1)
         _orchestrators["test-proj"] = orch
 
-        with patch("mycroft.server.agents.execution_dashboard.manager") as mock_manager:
-            mock_manager.send = AsyncMock()
-            await agent._handle_pause()
+        await agent._handle_pause()
 
         orch.pause_all.assert_called_once()
+        mock_manager.send_raw.assert_awaited_once_with(
+            "test-proj", orch.batch_update_json.return_value
+        )
 
     @pytest.mark.asyncio
-    async def test_pause_no_orchestrator(self):
+    async def test_pause_no_orchestrator(self, mock_manager):
         agent = _make_agent()
 
-        with patch("mycroft.server.agents.execution_dashboard.manager") as mock_manager:
-            mock_manager.send = AsyncMock()
-            await agent._handle_pause()
+        await agent._handle_pause()
 
         # Should send error message
         mock_manager.send.assert_called_once()
@@ -105,22 +128,20 @@ class TestDashboardPause:
 
 class TestDashboardResume:
     @pytest.mark.asyncio
-    async def test_resume_calls_orchestrator(self):
+    async def test_resume_calls_orchestrator(self, mock_manager):
         agent = _make_agent()
         orch = MagicMock(spec=Orchestrator)
         orch.state = MagicMock(total_tasks=5, queued=2, running=1, succeeded=1, failed=0, blocked=1)
         _orchestrators["test-proj"] = orch
 
-        with patch("mycroft.server.agents.execution_dashboard.manager") as mock_manager:
-            mock_manager.send = AsyncMock()
-            await agent._handle_resume()
+        await agent._handle_resume()
 
         orch.resume_all.assert_called_once()
 
 
 class TestDashboardStatus:
     @pytest.mark.asyncio
-    async def test_status_sends_data(self):
+    async def test_status_sends_data(self, mock_manager):
         agent = _make_agent()
         orch = MagicMock(spec=Orchestrator)
         orch.get_status.return_value = {
@@ -134,9 +155,7 @@ class TestDashboardStatus:
         }
         _orchestrators["test-proj"] = orch
 
-        with patch("mycroft.server.agents.execution_dashboard.manager") as mock_manager:
-            mock_manager.send_json = AsyncMock()
-            await agent._handle_status()
+        await agent._handle_status()
 
         mock_manager.send_json.assert_called_once()
         call_args = mock_manager.send_json.call_args
@@ -146,12 +165,10 @@ class TestDashboardStatus:
         assert data["total_tasks"] == 10
 
     @pytest.mark.asyncio
-    async def test_status_no_orchestrator(self):
+    async def test_status_no_orchestrator(self, mock_manager):
         agent = _make_agent()
 
-        with patch("mycroft.server.agents.execution_dashboard.manager") as mock_manager:
-            mock_manager.send = AsyncMock()
-            await agent._handle_status()
+        await agent._handle_status()
 
         mock_manager.send.assert_called_once()
         assert "No active execution" in mock_manager.send.call_args[0][1].message
@@ -159,29 +176,25 @@ class TestDashboardStatus:
 
 class TestDashboardRetry:
     @pytest.mark.asyncio
-    async def test_retry_resumes_service(self):
+    async def test_retry_resumes_service(self, mock_manager):
         agent = _make_agent()
         orch = MagicMock(spec=Orchestrator)
         orch.resume_service.return_value = True
         orch.state = MagicMock(total_tasks=5, queued=2, running=1, succeeded=1, failed=0, blocked=1)
         _orchestrators["test-proj"] = orch
 
-        with patch("mycroft.server.agents.execution_dashboard.manager") as mock_manager:
-            mock_manager.send = AsyncMock()
-            await agent._handle_retry("auth")
+        await agent._handle_retry("auth")
 
         orch.resume_service.assert_called_once_with("auth")
 
     @pytest.mark.asyncio
-    async def test_retry_unknown_service(self):
+    async def test_retry_unknown_service(self, mock_manager):
         agent = _make_agent()
         orch = MagicMock(spec=Orchestrator)
         orch.resume_service.return_value = False
         _orchestrators["test-proj"] = orch
 
-        with patch("mycroft.server.agents.execution_dashboard.manager") as mock_manager:
-            mock_manager.send = AsyncMock()
-            await agent._handle_retry("nonexistent")
+        await agent._handle_retry("nonexistent")
 
         assert "not found" in mock_manager.send.call_args[0][1].message
 
@@ -195,22 +208,8 @@ class TestPopulateFromLinear:
         agent = _make_agent()
         agent.project.metadata = {"linear_project_id": "lp1"}
 
-        from mycroft.server.linear.models import LinearIssue
-
-        mock_issues = [
-            # Story 1 (no parent)
-            LinearIssue(id="s1", identifier="ABC-1", title="[Auth] Authentication Service"),
-            # Story 2
-            LinearIssue(id="s2", identifier="ABC-2", title="[Payments] Payment Service"),
-            # Tasks under story 1
-            LinearIssue(id="t1", identifier="ABC-3", title="Implement login", parent_id="s1"),
-            LinearIssue(id="t2", identifier="ABC-4", title="Add JWT validation", parent_id="s1"),
-            # Task under story 2
-            LinearIssue(id="t3", identifier="ABC-5", title="Stripe integration", parent_id="s2"),
-        ]
-
         mock_client = AsyncMock()
-        mock_client.list_project_issues.return_value = mock_issues
+        mock_client.list_project_issues.return_value = list(_MOCK_LINEAR_ISSUES)
         mock_client.close = AsyncMock()
 
         exec_state = ExecutionState(project_id="test-proj")
@@ -271,36 +270,15 @@ class TestPopulateFromLinear:
 
 class TestRunRouting:
     @pytest.mark.asyncio
-    async def test_start_routes_to_handle_start(self):
-        agent = _make_agent()
-        agent._handle_start = AsyncMock()
-        await agent.run("start")
-        agent._handle_start.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_pause_routes_to_handle_pause(self):
-        agent = _make_agent()
-        agent._handle_pause = AsyncMock()
-        await agent.run("pause")
-        agent._handle_pause.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_resume_routes_to_handle_resume(self):
-        agent = _make_agent()
-        agent._handle_resume = AsyncMock()
-        await agent.run("resume")
-        agent._handle_resume.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_status_routes_to_handle_status(self):
-        agent = _make_agent()
-        agent._handle_status = AsyncMock()
-        await agent.run("status")
-        agent._handle_status.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_retry_routes_to_handle_retry(self):
+    @pytest.mark.parametrize("command, handler, args", [
+        ("start", "_handle_start", ()),
+        ("pause", "_handle_pause", ()),
+        ("resume", "_handle_resume", ()),
+        ("status", "_handle_status", ()),
+        ("retry auth-service", "_handle_retry", ("auth-service",)),
+    ])
+    async def test_routes_to_handler(self, command, handler, args):
         agent = _make_agent()
-        agent._handle_retry = AsyncMock()
-        await agent.run("retry auth-service")
-        agent._handle_retry.assert_called_once_with("auth-service")
+        setattr(agent, handler, AsyncMock())
+        await agent.run(command)
+        getattr(agent, handler).assert_called_once_with(*args)
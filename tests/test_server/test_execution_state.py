@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -47,7 +49,7 @@ def exec_state(patch_data_dir):
             service_name="api", task_ids=["t3"]
         ),
     }
-    state._recount()
+    state._full_recount()
     return state
 
 
@@ -66,6 +68,16 @@ class TestSaveLoadRoundTrip:
         exec_state.save()
         assert ExecutionState.exists("proj1")
 
+    def test_saves_compact_json(self, exec_state, monkeypatch):
+        exec_state.save()
+        assert b"\n" not in exec_state._path().read_bytes()
+
+        monkeypatch.setattr(
+            "mycroft.server.worker.execution_state.settings.pretty_state_files", True
+        )
+        exec_state.save()
+        assert exec_state._path().read_text().startswith('{\n  "project_id"')
+
     def test_not_exists(self, patch_data_dir):
         assert not ExecutionState.exists("nonexistent")
 
@@ -87,6 +99,30 @@ class TestSaveLoadRoundTrip:
         assert not loaded.blockers["b1"].resolved
 
 
+class TestCoalescedSave:
+    @pytest.mark.asyncio
+    async def test_completions_coalesce_into_one_write(self, exec_state):
+        path = exec_state._path()
+        with patch(
+            "mycroft.server.state.persistence.atomic_json_write"
+        ) as mock_write:
+            exec_state.checkpoint_task_completed("t1", success=True)
+            exec_state.checkpoint_task_completed("t2", success=True)
+            exec_state.checkpoint_task_completed("t3", success=False)
+            assert mock_write.call_count == 0
+            exec_state.flush()
+
+        mock_write.assert_called_once()
+        assert mock_write.call_args.args[0] == path
+        assert json.loads(mock_write.call_args.args[1])["succeeded"] == 2
+
+    @pytest.mark.asyncio
+    async def test_blocker_checkpoints_are_durable(self, exec_state):
+        exec_state.checkpoint_blocker_created("b1", "auth", "Which provider?")
+        assert exec_state._path().exists()
+        assert "b1" in ExecutionState.load("proj1").blockers
+
+
 class TestCheckpointTaskStarted:
     def test_marks_in_progress(self, exec_state):
         exec_state.checkpoint_task_started("t1")
@@ -105,6 +141,7 @@ class TestCheckpointTaskStarted:
 
     def test_nonexistent_task_is_noop(self, exec_state):
         exec_state.checkpoint_task_started("nonexistent")  # no error
+        assert not exec_state._path().exists()
 
 
 class TestCheckpointTaskCompleted:
@@ -117,6 +154,7 @@ class TestCheckpointTaskCompleted:
         assert exec_state.tasks["t1"].completed_at != ""
         assert "t1" in exec_state.services["auth"].completed_task_ids
         assert exec_state.succeeded == 1
+        assert exec_state.updated_at == exec_state.tasks["t1"].completed_at
 
     def test_marks_failed(self, exec_state):
         exec_state.checkpoint_task_started("t1")
@@ -138,6 +176,7 @@ class TestCheckpointTaskCompleted:
 
     def test_nonexistent_task_is_noop(self, exec_state):
         exec_state.checkpoint_task_completed("nonexistent", success=True)  # no error
+        assert not exec_state._path().exists()
 
     def test_persists_to_disk(self, exec_state, patch_data_dir):
         exec_state.checkpoint_task_completed("t1", success=True)
@@ -169,6 +208,7 @@ class TestCheckpointBlocker:
 
     def test_resolve_nonexistent_is_noop(self, exec_state):
         exec_state.checkpoint_blocker_resolved("nonexistent", "answer")  # no error
+        assert not exec_state._path().exists()
 
 
 class TestGetPendingTaskIds:
@@ -176,6 +216,22 @@ class TestGetPendingTaskIds:
         assert exec_state.get_pending_task_ids("auth") == ["t1", "t2"]
         assert exec_state.get_pending_task_ids("api") == ["t3"]
 
+    def test_index_built_on_construction(self):
+        state = ExecutionState(
+            project_id="proj1",
+            tasks={
+                "t1": TaskRecord(task_id="t1", title="A", service_name="auth"),
+                "t2": TaskRecord(
+                    task_id="t2", title="B", service_name="auth",
+                    status=TaskStatus.succeeded,
+                ),
+            },
+            services={"auth": ServiceRecord(service_name="auth", task_ids=["t1", "t2"])},
+        )
+        assert state.get_pending_task_ids("auth") == ["t1"]
+        assert [t.task_id for t in state.get_pending_tasks("auth")] == ["t1"]
+        assert state.pending == 1
+
     def test_excludes_completed(self, exec_state):
         exec_state.checkpoint_task_completed("t1", success=True)
         assert exec_state.get_pending_task_ids("auth") == ["t2"]
@@ -188,6 +244,19 @@ class TestGetPendingTaskIds:
     def test_nonexistent_service(self, exec_state):
         assert exec_state.get_pending_task_ids("nonexistent") == []
 
+    def test_get_pending_tasks_returns_records(self, exec_state):
+        exec_state.checkpoint_task_completed("t1", success=True)
+        assert exec_state.get_pending_tasks("auth") == [exec_state.tasks["t2"]]
+        assert exec_state.get_pending_tasks("nonexistent") == []
+
+    def test_rebuilt_on_load_and_not_persisted(self, exec_state):
+        exec_state.checkpoint_task_completed("t1", success=True)
+        exec_state.flush()
+
+        raw = json.loads(exec_state._path().read_text())
+        assert "pending_task_ids" not in raw["services"]["auth"]
+        assert ExecutionState.load("proj1").get_pending_task_ids("auth") == ["t2"]
+
 
 class TestGetTasksNeedingRequeue:
     def test_finds_in_progress(self, exec_state):
@@ -199,22 +268,58 @@ class TestGetTasksNeedingRequeue:
     def test_empty_when_none_in_progress(self, exec_state):
         assert exec_state.get_tasks_needing_requeue() == []
 
+    def test_index_built_on_construction(self):
+        state = ExecutionState(
+            project_id="proj1",
+            tasks={
+                "t1": TaskRecord(
+                    task_id="t1", title="A", service_name="auth",
+                    status=TaskStatus.in_progress,
+                ),
+            },
+        )
+        assert state.get_tasks_needing_requeue() == ["t1"]
+
+    def test_completed_task_leaves_index(self, exec_state):
+        exec_state.checkpoint_task_started("t1")
+        exec_state.checkpoint_task_completed("t1", success=False)
+        assert exec_state.get_tasks_needing_requeue() == []
+
+    def test_index_rebuilt_on_load(self, exec_state):
+        exec_state.checkpoint_task_started("t2")
+        exec_state.save()
+        exec_state.flush()
+        assert ExecutionState.load("proj1").get_tasks_needing_requeue() == ["t2"]
+
 
 class TestRecount:
     def test_recount_consistency(self, exec_state):
         exec_state.checkpoint_task_completed("t1", success=True)
         exec_state.checkpoint_task_completed("t2", success=False)
 
-        exec_state._recount()
+        exec_state._full_recount()
         assert exec_state.succeeded == 1
         assert exec_state.failed == 1
         assert exec_state.pending == 1  # t3
         assert exec_state.total_tasks == 3
 
+    def test_incremental_counters_match_full_recount(self, exec_state):
+        exec_state.checkpoint_task_started("t1")
+        exec_state.checkpoint_task_completed("t1", success=True)
+        exec_state.checkpoint_task_started("t2")
+        exec_state.checkpoint_task_completed("t2", success=False)
+        # Retry of a failed task moves it back to the pending bucket
+        exec_state.checkpoint_task_started("t2")
+
+        counts = (exec_state.succeeded, exec_state.failed, exec_state.pending)
+        exec_state._full_recount()
+        assert counts == (exec_state.succeeded, exec_state.failed, exec_state.pending)
+        assert counts == (1, 0, 2)
+
 
 class TestRecovery:
     @pytest.mark.asyncio
-    async def test_resets_in_progress_to_pending(self, patch_data_dir, monkeypatch):
+    async def test_marks_in_progress_as_aborted(self, patch_data_dir, monkeypatch):
         monkeypatch.setattr(
             "mycroft.server.worker.execution_state.settings.linear_api_key", ""
         )
@@ -247,15 +352,18 @@ class TestRecovery:
                 service_name="api", task_ids=["t3"]
             ),
         }
-        state._recount()
+        state._full_recount()
         state.save()
 
         recovered = await recover_execution("proj1")
 
         assert recovered.tasks["t1"].status == TaskStatus.succeeded
-        assert recovered.tasks["t2"].status == TaskStatus.pending
+        assert recovered.tasks["t2"].status == TaskStatus.aborted
+        assert recovered.tasks["t2"].last_phase == "in_progress"
         assert recovered.tasks["t3"].status == TaskStatus.pending
+        assert recovered.tasks["t3"].last_phase == ""
         assert recovered.services["auth"].current_task_id == ""
+        assert recovered.get_pending_task_ids("auth") == ["t2"]
         assert recovered.succeeded == 1
         assert recovered.pending == 2
 
@@ -284,14 +392,84 @@ class TestRecovery:
         mock_lc.get_issue_comments = AsyncMock(return_value=[mock_comment])
 
         with patch(
-            "mycroft.server.linear.client.LinearClient",
-            return_value=mock_lc,
+            "mycroft.server.worker.blocker._linear_client",
+            mock_lc,
         ):
             recovered = await recover_execution("proj1")
 
         assert recovered.blockers["b1"].resolved
         assert recovered.blockers["b1"].answer == "Use Google OAuth"
 
+    @pytest.mark.asyncio
+    async def test_reconcile_failure_is_per_blocker(self, patch_data_dir, monkeypatch):
+        monkeypatch.setattr(
+            "mycroft.server.worker.execution_state.settings.linear_api_key", "test-key"
+        )
+        (patch_data_dir / "proj1").mkdir()
+
+        state = ExecutionState(project_id="proj1")
+        state.blockers = {
+            bid: BlockerRecord(
+                blocker_id=bid, service_name="auth", question="q", linear_issue_id=lin
+            )
+            for bid, lin in (("b1", "lin-1"), ("b2", "lin-2"), ("b3", "lin-3"))
+        }
+        state.save()
+
+        comment = AsyncMock()
+        comment.body = "answer"
+
+        async def get_comments(issue_id):
+            if issue_id == "lin-2":
+                raise RuntimeError("boom")
+            return [comment] if issue_id == "lin-1" else []
+
+        mock_lc = AsyncMock()
+        mock_lc.get_issue_comments = AsyncMock(side_effect=get_comments)
+
+        with patch("mycroft.server.worker.blocker._linear_client", mock_lc):
+            recovered = await recover_execution("proj1")
+
+        assert mock_lc.get_issue_comments.await_count == 3
+        assert recovered.blockers["b1"].resolved
+        assert not recovered.blockers["b2"].resolved
+        assert not recovered.blockers["b3"].resolved
+
+    @pytest.mark.asyncio
+    async def test_reconciles_blockers_concurrently(self, patch_data_dir, monkeypatch):
+        monkeypatch.setattr(
+            "mycroft.server.worker.execution_state.settings.linear_api_key", "test-key"
+        )
+        (patch_data_dir / "proj1").mkdir()
+
+        state = ExecutionState(project_id="proj1")
+        state.blockers = {
+            bid: BlockerRecord(
+                blocker_id=bid, service_name="auth", question="q", linear_issue_id=lin
+            )
+            for bid, lin in (("b1", "lin-1"), ("b2", "lin-2"))
+        }
+        state.save()
+
+        in_flight = 0
+        peak = 0
+
+        async def get_comments(issue_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return []
+
+        mock_lc = AsyncMock()
+        mock_lc.get_issue_comments = AsyncMock(side_effect=get_comments)
+
+        with patch("mycroft.server.worker.blocker._linear_client", mock_lc):
+            await recover_execution("proj1")
+
+        assert peak == 2
+
     @pytest.mark.asyncio
     async def test_all_tasks_completed(self, patch_data_dir, monkeypatch):
         """Recovery with all tasks done — nothing to resume."""
@@ -314,7 +492,7 @@ class TestRecovery:
                 completed_task_ids=["t1"],
             ),
         }
-        state._recount()
+        state._full_recount()
         state.save()
 
         recovered = await recover_execution("proj1")
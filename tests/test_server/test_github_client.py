@@ -7,43 +7,47 @@ import pytest
 
 from mycroft.server.git.github import GitHubClient, GitHubClientError
 
-_FAKE_REQUEST = httpx.Request("GET", "https://api.github.com")
 
+def _client(handler) -> GitHubClient:
+    return GitHubClient(token="test-token", transport=httpx.MockTransport(handler))
 
-def _mock_response(data: dict, status_code: int = 200) -> httpx.Response:
-    return httpx.Response(status_code, json=data, request=_FAKE_REQUEST)
 
-
-async def _async_return(val):
-    return val
+def _respond(data, status_code: int = 200):
+    return lambda request: httpx.Response(status_code, json=data)
 
 
 class TestGetRepo:
     @pytest.mark.asyncio
-    async def test_success(self, monkeypatch):
-        client = GitHubClient(token="test-token")
-        resp = _mock_response({"id": 1, "name": "my-repo", "full_name": "org/my-repo"})
-        monkeypatch.setattr(
-            httpx.AsyncClient, "request", lambda self, *a, **kw: _async_return(resp)
-        )
+    async def test_success(self):
+        client = _client(_respond({"id": 1, "name": "my-repo", "full_name": "org/my-repo"}))
         repo = await client.get_repo("org", "my-repo")
         assert repo["name"] == "my-repo"
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_sends_auth_header(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={})
+
+        client = _client(handler)
+        await client.get_repo("org", "my-repo")
+        assert seen[0].url == "https://api.github.com/repos/org/my-repo"
+        assert seen[0].headers["Authorization"] == "Bearer test-token"
+        await client.close()
+
 
 class TestCreateRepoFromTemplate:
     @pytest.mark.asyncio
-    async def test_success(self, monkeypatch):
-        client = GitHubClient(token="test-token")
-        resp = _mock_response({
+    async def test_success(self):
+        client = _client(_respond({
             "id": 2,
             "name": "new-project",
             "full_name": "org/new-project",
             "html_url": "https://github.com/org/new-project",
-        }, status_code=201)
-        monkeypatch.setattr(
-            httpx.AsyncClient, "request", lambda self, *a, **kw: _async_return(resp)
-        )
+        }, status_code=201))
         repo = await client.create_repo_from_template(
             "org", "template-repo", "new-project", owner="org"
         )
@@ -51,16 +55,8 @@ class TestCreateRepoFromTemplate:
         await client.close()
 
     @pytest.mark.asyncio
-    async def test_error(self, monkeypatch):
-        client = GitHubClient(token="test-token")
-        resp = httpx.Response(
-            422,
-            json={"message": "Validation Failed"},
-            request=_FAKE_REQUEST,
-        )
-        monkeypatch.setattr(
-            httpx.AsyncClient, "request", lambda self, *a, **kw: _async_return(resp)
-        )
+    async def test_error(self):
+        client = _client(_respond({"message": "Validation Failed"}, status_code=422))
         with pytest.raises(GitHubClientError, match="422"):
             await client.create_repo_from_template(
                 "org", "template-repo", "new-project"
@@ -70,16 +66,12 @@ class TestCreateRepoFromTemplate:
 
 class TestCreatePullRequest:
     @pytest.mark.asyncio
-    async def test_success_without_labels(self, monkeypatch):
-        client = GitHubClient(token="test-token")
-        resp = _mock_response({
+    async def test_success_without_labels(self):
+        client = _client(_respond({
             "number": 42,
             "title": "feat: add auth",
             "html_url": "https://github.com/org/repo/pull/42",
-        }, status_code=201)
-        monkeypatch.setattr(
-            httpx.AsyncClient, "request", lambda self, *a, **kw: _async_return(resp)
-        )
+        }, status_code=201))
         pr = await client.create_pull_request(
             "org", "repo", "feat: add auth", "mycroft/auth-1"
         )
@@ -87,17 +79,16 @@ class TestCreatePullRequest:
         await client.close()
 
     @pytest.mark.asyncio
-    async def test_success_with_labels(self, monkeypatch):
-        client = GitHubClient(token="test-token")
+    async def test_success_with_labels(self):
         calls = []
 
-        async def mock_request(self, method, path, **kwargs):
-            calls.append((method, path))
-            if method == "POST" and "/pulls" in path:
-                return _mock_response({"number": 10, "title": "test"}, 201)
-            return _mock_response([{"name": "auto-merge"}])
+        def handler(request):
+            calls.append((request.method, request.url.path))
+            if request.url.path.endswith("/pulls"):
+                return httpx.Response(201, json={"number": 10, "title": "test"})
+            return httpx.Response(200, json=[{"name": "auto-merge"}])
 
-        monkeypatch.setattr(httpx.AsyncClient, "request", mock_request)
+        client = _client(handler)
         pr = await client.create_pull_request(
             "org", "repo", "test", "branch", labels=["auto-merge"]
         )
@@ -5,7 +5,11 @@ from __future__ import annotations
 import httpx
 import pytest
 
-from mycroft.server.linear.client import LinearClient, LinearClientError
+from mycroft.server.linear.client import (
+    LinearBatchError,
+    LinearClient,
+    LinearClientError,
+)
 from mycroft.server.linear.models import LinearIssueCreateInput
 
 
@@ -95,6 +99,25 @@ class TestCreateIssue:
         assert issue.parent_id == "i1"
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_query_is_minified(self, monkeypatch):
+        client = LinearClient(api_key="test-key", api_url="https://test.linear.app/graphql")
+        sent: list[dict] = []
+
+        async def mock_post(self, *args, **kwargs):
+            sent.append(kwargs["json"])
+            return _mock_response({
+                "issueCreate": {"success": True, "issue": {"id": "i1"}},
+            })
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        await client.create_issue(LinearIssueCreateInput(title="T", team_id="team1"))
+        query = sent[0]["query"]
+        assert query.startswith("mutation($input: IssueCreateInput!) {")
+        assert "\n" not in query
+        assert "  " not in query
+        await client.close()
+
 
 class TestGetIssue:
     @pytest.mark.asyncio
@@ -382,6 +405,27 @@ class TestErrorHandling:
         assert call_count == 3
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_rate_limit_backoff_without_retry_after(self, monkeypatch):
+        client = LinearClient(api_key="test-key", api_url="https://test.linear.app/graphql")
+        sleeps: list[float] = []
+
+        async def mock_sleep(delay):
+            sleeps.append(delay)
+
+        async def mock_post(self, *args, **kwargs):
+            return httpx.Response(429, request=_FAKE_REQUEST)
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        monkeypatch.setattr("mycroft.server.linear.client.asyncio.sleep", mock_sleep)
+        with pytest.raises(LinearClientError):
+            await client.create_project("Test", ["team1"])
+        assert len(sleeps) == 3
+        assert 2.0 <= sleeps[0] < 2.25
+        assert 4.0 <= sleeps[1] < 4.25
+        assert 8.0 <= sleeps[2] < 8.25
+        await client.close()
+
 
 class TestBatchHelpers:
     @pytest.mark.asyncio
@@ -419,6 +463,72 @@ class TestBatchHelpers:
         assert issues[2].id == "i3"
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_create_relations_batch_aliases_mutations(self, monkeypatch):
+        client = LinearClient(api_key="test-key", api_url="https://test.linear.app/graphql")
+        payloads: list[dict] = []
+
+        async def mock_post(self, *args, **kwargs):
+            payload = kwargs["json"]
+            payloads.append(payload)
+            data = {
+                f"op{i}": {
+                    "success": True,
+                    "issueRelation": {
+                        "id": f"r-{inp['issueId']}",
+                        "issueId": inp["issueId"],
+                        "relatedIssueId": inp["relatedIssueId"],
+                        "type": inp["type"],
+                    },
+                }
+                for i, inp in enumerate(payload["variables"].values())
+            }
+            return _mock_response(data)
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        monkeypatch.setattr("mycroft.server.linear.client.asyncio.sleep", _async_noop)
+        relations = [(f"i{n}", f"j{n}", "blocks") for n in range(30)]
+        rels = await client.create_relations_batch(relations)
+
+        assert len(payloads) == 2  # 25 + 5
+        assert "op24: issueRelationCreate" in payloads[0]["query"]
+        assert len(payloads[1]["variables"]) == 5
+        assert [r.issue_id for r in rels] == [f"i{n}" for n in range(30)]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_create_relations_batch_keeps_partial_success(self, monkeypatch):
+        client = LinearClient(api_key="test-key", api_url="https://test.linear.app/graphql")
+
+        async def mock_post(self, *args, **kwargs):
+            inputs = list(kwargs["json"]["variables"].values())
+            data = {
+                f"op{i}": None if inp["issueId"] == "i1" else {
+                    "success": True,
+                    "issueRelation": {
+                        "id": f"r-{inp['issueId']}",
+                        "issueId": inp["issueId"],
+                        "relatedIssueId": inp["relatedIssueId"],
+                        "type": inp["type"],
+                    },
+                }
+                for i, inp in enumerate(inputs)
+            }
+            errors = [{"message": "Issue not found", "path": ["op1"]}]
+            return httpx.Response(
+                200, json={"data": data, "errors": errors}, request=_FAKE_REQUEST
+            )
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        relations = [(f"i{n}", f"j{n}", "blocks") for n in range(3)]
+        with pytest.raises(LinearBatchError) as exc:
+            await client.create_relations_batch(relations)
+
+        assert [r.issue_id for r in exc.value.succeeded] == ["i0", "i2"]
+        assert exc.value.failed == [("i1", "j1", "blocks")]
+        assert exc.value.errors[0]["path"] == ["op1"]
+        await client.close()
+
 
 # ── Helpers ──────────────────────────────────────────────────
 
@@ -147,7 +147,7 @@ class TestCommentBlockerWebhook:
     def test_comment_resolves_blocker(self, client, monkeypatch):
         monkeypatch.setattr("mycroft.server.linear.webhook.settings.linear_webhook_secret", "")
 
-        from mycroft.server.worker.blocker import PendingBlocker, _blockers, clear_all_blockers
+        from mycroft.server.worker.blocker import PendingBlocker, _register, clear_all_blockers
         # Import the handler module to register its handler
         import mycroft.server.linear.blocker_webhook  # noqa: F401
 
@@ -160,7 +160,7 @@ class TestCommentBlockerWebhook:
                 question="How to handle OAuth?",
                 linear_issue_id="issue-123",
             )
-            _blockers["b1"] = blocker
+            _register(blocker)
 
             # POST a comment webhook for that issue
             payload = {
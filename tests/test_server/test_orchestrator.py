@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+
 import pytest
 
 from mycroft.server.worker.execution_state import (
@@ -18,7 +21,7 @@ from mycroft.server.worker.team_lead import TeamLead
 @pytest.fixture()
 def orchestrator(tmp_path, monkeypatch):
     """Create an orchestrator with 2 Team Leads and mocked sub-agents."""
-    monkeypatch.setattr("mycroft.server.worker.orchestrator.manager.send", _mock_send)
+    monkeypatch.setattr("mycroft.server.worker.orchestrator.manager.send_raw", _mock_send)
 
     orch = Orchestrator("proj1")
 
@@ -81,19 +84,19 @@ class TestOrchestratorExecution:
         _mock_all_sub_agents(monkeypatch)
 
         orchestrator.pause_all()
-        assert all(lead.is_paused for lead in orchestrator._leads.values())
+        assert all(lead.is_paused for lead in orchestrator._leads)
 
         orchestrator.resume_all()
-        assert all(not lead.is_paused for lead in orchestrator._leads.values())
+        assert all(not lead.is_paused for lead in orchestrator._leads)
 
     @pytest.mark.asyncio
     async def test_pause_single_service(self, orchestrator):
         assert orchestrator.pause_service("auth") is True
-        assert orchestrator._leads["auth"].is_paused
-        assert not orchestrator._leads["api"].is_paused
+        assert orchestrator.get_lead("auth").is_paused
+        assert not orchestrator.get_lead("api").is_paused
 
         assert orchestrator.resume_service("auth") is True
-        assert not orchestrator._leads["auth"].is_paused
+        assert not orchestrator.get_lead("auth").is_paused
 
     def test_pause_nonexistent_service(self, orchestrator):
         assert orchestrator.pause_service("nonexistent") is False
@@ -105,7 +108,102 @@ class TestOrchestratorExecution:
         await orchestrator.start()
         await orchestrator.shutdown()
         # After shutdown, all leads should be cancelled
-        assert all(lead.state.cancelled for lead in orchestrator._leads.values())
+        assert all(lead.state.cancelled for lead in orchestrator._leads)
+
+    @pytest.mark.asyncio
+    async def test_task_statuses_sent_as_one_frame_per_service(
+        self, orchestrator, monkeypatch
+    ):
+        _mock_all_sub_agents(monkeypatch)
+        sent = []
+
+        async def _record_send(project_id, payload):
+            sent.append(json.loads(payload))
+            return True
+
+        monkeypatch.setattr(
+            "mycroft.server.worker.orchestrator.manager.send_raw", _record_send
+        )
+        await orchestrator.start()
+        await orchestrator.wait()
+
+        by_type = {}
+        for msg in sent:
+            by_type.setdefault(msg["type"], []).append(msg)
+        [batch] = by_type["worker_status_batch"]
+        assert batch["service_name"] == "auth"
+        assert batch["task_ids"] == ["t1", "t2"]
+        assert batch["statuses"] == ["succeeded", "succeeded"]
+        [single] = by_type["worker_status"]
+        assert single["task_id"] == "t3"
+
+    @pytest.mark.asyncio
+    async def test_batch_updates_are_debounced(self, orchestrator, monkeypatch):
+        sent = []
+
+        async def _record_send(project_id, payload):
+            sent.append(payload)
+            return True
+
+        monkeypatch.setattr(
+            "mycroft.server.worker.orchestrator.manager.send_raw", _record_send
+        )
+        monkeypatch.setattr("mycroft.server.worker.orchestrator.BROADCAST_DEBOUNCE", 0)
+        orchestrator._broadcaster = asyncio.create_task(orchestrator._broadcast_loop())
+        for _ in range(5):
+            orchestrator._broadcast_dirty.set()
+        await asyncio.sleep(0.01)
+
+        assert len(sent) == 1
+        await orchestrator.shutdown()
+        assert len(sent) == 2  # final snapshot on shutdown
+
+    @pytest.mark.asyncio
+    async def test_broadcast_loop_survives_send_error(self, orchestrator, monkeypatch):
+        sent = []
+
+        async def _flaky_send(project_id, payload):
+            if not sent:
+                sent.append(None)
+                raise RuntimeError("socket gone")
+            sent.append(payload)
+            return True
+
+        monkeypatch.setattr(
+            "mycroft.server.worker.orchestrator.manager.send_raw", _flaky_send
+        )
+        monkeypatch.setattr("mycroft.server.worker.orchestrator.BROADCAST_DEBOUNCE", 0)
+        orchestrator._broadcaster = asyncio.create_task(orchestrator._broadcast_loop())
+        orchestrator._broadcast_dirty.set()
+        await asyncio.sleep(0.01)
+        orchestrator._broadcast_dirty.set()
+        await asyncio.sleep(0.01)
+
+        assert not orchestrator._broadcaster.done()
+        assert len(sent) == 2
+        await orchestrator.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_batch_payload_reused_until_counters_change(
+        self, orchestrator, monkeypatch
+    ):
+        sent = []
+
+        async def _record_send(project_id, payload):
+            sent.append(payload)
+            return True
+
+        monkeypatch.setattr(
+            "mycroft.server.worker.orchestrator.manager.send_raw", _record_send
+        )
+        await orchestrator._broadcast_batch()
+        await orchestrator._broadcast_batch()
+        orchestrator.state.succeeded += 1
+        await orchestrator._broadcast_batch()
+
+        assert sent[0] is sent[1]
+        assert json.loads(sent[0])["type"] == "worker_batch"
+        assert json.loads(sent[2])["succeeded"] == 1
 
 
 # ── Helpers ──────────────────────────────────────────────────
@@ -133,7 +231,7 @@ def _mock_all_sub_agents(monkeypatch):
 
 class TestFromExecutionState:
     def test_rebuilds_with_pending_tasks(self, tmp_path, monkeypatch):
-        monkeypatch.setattr("mycroft.server.worker.orchestrator.manager.send", _mock_send)
+        monkeypatch.setattr("mycroft.server.worker.orchestrator.manager.send_raw", _mock_send)
         monkeypatch.setattr(
             "mycroft.server.worker.execution_state.settings.data_dir", tmp_path
         )
@@ -164,7 +262,7 @@ class TestFromExecutionState:
                 service_name="api", task_ids=["t3"],
             ),
         }
-        exec_state._recount()
+        exec_state._full_recount()
 
         orch = Orchestrator.from_execution_state(
             exec_state,
@@ -173,20 +271,20 @@ class TestFromExecutionState:
             business_spec="spec",
         )
 
-        assert "auth" in orch._leads
-        assert "api" in orch._leads
+        assert orch.get_lead("auth") is not None
+        assert orch.get_lead("api") is not None
         # auth lead only has 1 pending task (t2), t1 is done
-        assert len(orch._leads["auth"].state.tasks) == 1
-        assert orch._leads["auth"].state.tasks[0]["id"] == "t2"
+        assert len(orch.get_lead("auth").state.tasks) == 1
+        assert orch.get_lead("auth").state.tasks[0]["id"] == "t2"
         # api lead has 1 task
-        assert len(orch._leads["api"].state.tasks) == 1
+        assert len(orch.get_lead("api").state.tasks) == 1
         # Counters
         assert orch.state.succeeded == 1
         assert orch.state.queued == 2  # t2 + t3
         assert orch.state.total_tasks == 3  # 1 done + 2 queued
 
     def test_skips_completed_services(self, tmp_path, monkeypatch):
-        monkeypatch.setattr("mycroft.server.worker.orchestrator.manager.send", _mock_send)
+        monkeypatch.setattr("mycroft.server.worker.orchestrator.manager.send_raw", _mock_send)
         monkeypatch.setattr(
             "mycroft.server.worker.execution_state.settings.data_dir", tmp_path
         )
@@ -206,7 +304,7 @@ class TestFromExecutionState:
                 completed_task_ids=["t1"],
             ),
         }
-        exec_state._recount()
+        exec_state._full_recount()
 
         orch = Orchestrator.from_execution_state(
             exec_state,
@@ -216,14 +314,14 @@ class TestFromExecutionState:
         )
 
         # auth is fully complete — no Team Lead created
-        assert "auth" not in orch._leads
+        assert orch.get_lead("auth") is None
         assert orch.state.succeeded == 1
         assert orch.state.queued == 0
 
     @pytest.mark.asyncio
     async def test_from_execution_state_runs(self, tmp_path, monkeypatch):
         """End-to-end: recover and run remaining tasks."""
-        monkeypatch.setattr("mycroft.server.worker.orchestrator.manager.send", _mock_send)
+        monkeypatch.setattr("mycroft.server.worker.orchestrator.manager.send_raw", _mock_send)
         monkeypatch.setattr(
             "mycroft.server.worker.execution_state.settings.data_dir", tmp_path
         )
@@ -248,7 +346,7 @@ class TestFromExecutionState:
                 completed_task_ids=["t1"],
             ),
         }
-        exec_state._recount()
+        exec_state._full_recount()
 
         orch = Orchestrator.from_execution_state(
             exec_state,
@@ -1,11 +1,16 @@
 """Tests for atomic file persistence."""
 
+import asyncio
 import json
 
 import pytest
 
 from mycroft.server.state.persistence import (
     atomic_json_write,
+    deferred_json_write,
+    discard_jsonl,
+    flush_json_writes,
+    flush_jsonl,
     json_read,
     jsonl_append,
     jsonl_read,
@@ -37,6 +42,11 @@ class TestAtomicJsonWrite:
         assert len(files) == 1
         assert files[0].name == "test.json"
 
+    def test_write_preencoded_bytes(self, tmp_path):
+        path = tmp_path / "test.json"
+        atomic_json_write(path, b'{"raw":true}')
+        assert path.read_bytes() == b'{"raw":true}'
+
 
 class TestJsonRead:
     def test_read_valid(self, tmp_path):
@@ -55,6 +65,51 @@ class TestJsonRead:
             json_read(path)
 
 
+class TestDeferredJsonWrite:
+    def test_writes_immediately_outside_event_loop(self, tmp_path):
+        path = tmp_path / "state.json"
+        deferred_json_write(path, lambda: {"v": 1})
+        assert json.loads(path.read_text()) == {"v": 1}
+
+    @pytest.mark.asyncio
+    async def test_coalesces_to_latest(self, tmp_path):
+        path = tmp_path / "state.json"
+        calls = []
+
+        def build(v):
+            calls.append(v)
+            return {"v": v}
+
+        deferred_json_write(path, lambda: build(1))
+        deferred_json_write(path, lambda: build(2))
+        assert not path.exists()
+        flush_json_writes(path)
+        assert json.loads(path.read_text()) == {"v": 2}
+        assert calls == [2]
+
+    @pytest.mark.asyncio
+    async def test_read_sees_deferred_write(self, tmp_path):
+        path = tmp_path / "state.json"
+        deferred_json_write(path, lambda: {"v": 1})
+        assert json_read(path) == {"v": 1}
+
+    @pytest.mark.asyncio
+    async def test_durable_write_supersedes_deferred(self, tmp_path):
+        path = tmp_path / "state.json"
+        deferred_json_write(path, lambda: {"v": "old"})
+        atomic_json_write(path, {"v": "new"})
+        flush_json_writes(path)
+        assert json.loads(path.read_text()) == {"v": "new"}
+
+    def test_write_after_dir_removed(self, tmp_path):
+        path = tmp_path / "d" / "state.json"
+        atomic_json_write(path, {"v": 1})
+        path.unlink()
+        path.parent.rmdir()
+        atomic_json_write(path, {"v": 2})
+        assert json.loads(path.read_text()) == {"v": 2}
+
+
 class TestJsonlAppend:
     def test_append_creates_file(self, tmp_path):
         path = tmp_path / "log.jsonl"
@@ -77,6 +132,50 @@ class TestJsonlAppend:
         jsonl_append(path, {"nested": True})
         assert path.exists()
 
+    @pytest.mark.asyncio
+    async def test_append_in_event_loop_is_buffered(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        jsonl_append(path, {"n": 1})
+        jsonl_append(path, {"n": 2})
+        assert not path.exists()
+        flush_jsonl(path)
+        assert len(path.read_text().strip().split("\n")) == 2
+
+    @pytest.mark.asyncio
+    async def test_buffered_append_flushes_after_interval(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("mycroft.server.state.persistence.JSONL_FLUSH_INTERVAL", 0)
+        path = tmp_path / "log.jsonl"
+        jsonl_append(path, {"n": 1})
+        await asyncio.sleep(0.01)
+        assert path.exists()
+
+    @pytest.mark.asyncio
+    async def test_read_sees_buffered_appends(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        jsonl_append(path, {"n": 1})
+        assert jsonl_read(path) == [{"n": 1}]
+
+    @pytest.mark.asyncio
+    async def test_read_does_not_flush_buffer(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        path.write_text('{"n": 1}\n')
+        jsonl_append(path, {"n": 2})
+        assert jsonl_read(path) == [{"n": 1}, {"n": 2}]
+        # The write stays deferred to the flush timer
+        assert path.read_text() == '{"n": 1}\n'
+        flush_jsonl(path)
+        assert jsonl_read(path) == [{"n": 1}, {"n": 2}]
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_buffer(self, tmp_path):
+        (tmp_path / "blocked").write_text("")
+        path = tmp_path / "blocked" / "log.jsonl"
+        jsonl_append(path, {"n": 1})
+        with pytest.raises(OSError):
+            flush_jsonl(path)
+        assert jsonl_read(path) == [{"n": 1}]
+        discard_jsonl(path)
+
 
 class TestJsonlRead:
     def test_read_missing_returns_empty(self, tmp_path):
@@ -54,6 +54,37 @@ class TestProjectStateSlug:
         p = ProjectState(project_name="test123")
         assert p.slug == "test123"
 
+    def test_non_ascii_name(self):
+        p = ProjectState(project_name="Café Über")
+        assert p.slug == "caf-ber"
+
+    def test_rename_invalidates_slug(self):
+        p = ProjectState(project_name="Old Name")
+        assert p.slug == "old-name"
+        p.project_name = "New Name"
+        assert p.slug == "new-name"
+
+    def test_model_copy_uses_new_name(self):
+        p = ProjectState(project_name="Old Name")
+        assert p.slug == "old-name"
+        assert p.model_copy(update={"project_name": "New Name"}).slug == "new-name"
+
+    def test_slug_not_persisted(self):
+        p = ProjectState(project_name="My App")
+        assert p.slug == "my-app"
+        assert "slug" not in p.model_dump()
+
+    def test_sync_steps_cached_until_status_changes(self):
+        p = ProjectState()
+        steps = p.sync_steps()
+        assert p.sync_steps() is steps
+        assert [s.step_id for s in steps] == STEP_ORDER
+
+        p.steps[StepId.IDEA_SCOPING].status = StepStatus.LOCKED
+        updated = p.sync_steps()
+        assert updated is not steps
+        assert updated[0].status == StepStatus.LOCKED
+
 
 class TestProjectStatePersistence:
     def test_save_and_load(self, patch_projects_dir):
@@ -91,6 +122,13 @@ class TestProjectStatePersistence:
         names = {p.project_name for p in projects}
         assert names == {"One", "Two"}
 
+    def test_list_all_skips_dirs_without_state(self, patch_projects_dir):
+        ProjectState(project_name="One").save()
+        (patch_projects_dir / "projects" / "stray").mkdir()
+
+        projects = ProjectState.list_all()
+        assert [p.project_name for p in projects] == ["One"]
+
     def test_save_preserves_step_state(self, patch_projects_dir):
         p = ProjectState()
         p.steps[StepId.IDEA_SCOPING].status = StepStatus.LOCKED
@@ -5,9 +5,12 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
+from claude_agent_sdk import AssistantMessage, ResultMessage, TextBlock
 
 from mycroft.server.worker.sub_agents import (
     SubAgentResult,
+    _code_writer_system,
+    _run_session,
     run_code_writer,
     run_qa_tester,
     run_unit_tester,
@@ -49,6 +52,71 @@ class TestQATester:
             assert "claude_agent_sdk" in result.error or result.error
 
 
+class TestWithoutSdk:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("runner, args", [
+        (run_code_writer, ("implement login", "# CLAUDE.md")),
+        (run_unit_tester, ("test login", "# CLAUDE.md")),
+        (run_qa_tester, ("Business spec", ["pytest tests/"])),
+    ])
+    async def test_returns_mock_result(self, tmp_path, monkeypatch, runner, args):
+        monkeypatch.setattr("mycroft.server.worker.sub_agents._SDK_AVAILABLE", False)
+        result = await runner(tmp_path, *args)
+        assert result.success is False
+        assert result.error == "claude_agent_sdk not installed"
+
+
+class _FakeClient:
+    instances: list[_FakeClient] = []
+
+    def __init__(self, options):
+        self.options = options
+        self.connected = False
+        self.prompts: list[str] = []
+        _FakeClient.instances.append(self)
+
+    async def __aenter__(self):
+        self.connected = True
+        return self
+
+    async def __aexit__(self, *exc):
+        self.connected = False
+
+    async def query(self, prompt):
+        self.prompts.append(prompt)
+
+    async def receive_response(self):
+        yield AssistantMessage(content=[TextBlock(text=f"echo: {self.prompts[-1]}")], model="m")
+        yield ResultMessage(
+            subtype="success", duration_ms=1, duration_api_ms=1, is_error=False,
+            num_turns=1, session_id="s",
+        )
+
+
+class TestRunSession:
+    @pytest.mark.asyncio
+    async def test_each_run_gets_its_own_client(self, monkeypatch):
+        _FakeClient.instances.clear()
+        monkeypatch.setattr("mycroft.server.worker.sub_agents.ClaudeSDKClient", _FakeClient)
+
+        assert await _run_session("opts", "one") == "echo: one"
+        assert await _run_session("opts", "two") == "echo: two"
+
+        a, b = _FakeClient.instances
+        # No conversation history is shared between runs
+        assert a.prompts == ["one"]
+        assert b.prompts == ["two"]
+        assert not a.connected and not b.connected
+
+
+class TestSystemPrompts:
+    def test_built_once_per_worktree_and_claude_md(self, tmp_path):
+        first = _code_writer_system(tmp_path, "# CLAUDE.md")
+        assert _code_writer_system(tmp_path, "# CLAUDE.md") is first
+        assert "# CLAUDE.md" in first
+        assert str(tmp_path) in first
+
+
 class TestSubAgentResult:
     def test_defaults(self):
         r = SubAgentResult(success=True, output="done")
@@ -58,3 +126,4 @@ class TestSubAgentResult:
     def test_failure(self):
         r = SubAgentResult(success=False, output="", error="boom")
         assert r.error == "boom"
+
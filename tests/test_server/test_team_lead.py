@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from mycroft.server.worker.execution_state import (
@@ -11,7 +13,11 @@ from mycroft.server.worker.execution_state import (
     TaskStatus,
 )
 from mycroft.server.worker.sub_agents import SubAgentResult
-from mycroft.server.worker.team_lead import TaskResult, TeamLead, TeamLeadState
+from mycroft.server.worker.team_lead import (
+    TaskResult,
+    TeamLead,
+    TeamLeadState,
+)
 
 
 @pytest.fixture()
@@ -93,6 +99,85 @@ class TestTeamLeadExecution:
         assert len(results) == 0
 
 
+    @pytest.mark.asyncio
+    async def test_paused_lead_waits_for_resume(self, team_lead, monkeypatch):
+        _mock_all_sub_agents_success(monkeypatch)
+
+        team_lead.pause()
+        run = asyncio.create_task(team_lead.run())
+        await asyncio.sleep(0.01)
+        assert not run.done()
+        assert team_lead.state.completed == []
+
+        team_lead.resume()
+        results = await asyncio.wait_for(run, timeout=1)
+        assert len(results) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancel_while_paused(self, team_lead, monkeypatch):
+        _mock_all_sub_agents_success(monkeypatch)
+
+        team_lead.pause()
+        run = asyncio.create_task(team_lead.run())
+        await asyncio.sleep(0.01)
+        team_lead.cancel()
+        assert await asyncio.wait_for(run, timeout=1) == []
+
+    @pytest.mark.asyncio
+    async def test_qa_runs_after_unit_tester(self, team_lead, monkeypatch):
+        order = []
+
+        async def mock_unit_tester(*args, **kwargs):
+            order.append("unit_start")
+            await asyncio.sleep(0)
+            order.append("unit_end")
+            return SubAgentResult(success=True, output="tests")
+
+        async def mock_qa_tester(*args, **kwargs):
+            order.append("qa")
+            return SubAgentResult(success=True, output="qa")
+
+        monkeypatch.setattr(
+            "mycroft.server.worker.team_lead.run_code_writer", _mock_success
+        )
+        monkeypatch.setattr(
+            "mycroft.server.worker.team_lead.run_unit_tester", mock_unit_tester
+        )
+        monkeypatch.setattr(
+            "mycroft.server.worker.team_lead.run_qa_tester", mock_qa_tester
+        )
+
+        result = await team_lead._execute_task(team_lead.state.tasks[0])
+        assert result.success
+        assert order == ["unit_start", "unit_end", "qa"]
+
+    @pytest.mark.asyncio
+    async def test_unit_tester_failure_skips_qa(self, team_lead, monkeypatch):
+        qa_calls = []
+
+        async def mock_unit_tester(*args, **kwargs):
+            return SubAgentResult(success=False, output="", error="no tests")
+
+        async def mock_qa_tester(*args, **kwargs):
+            qa_calls.append(args)
+            return SubAgentResult(success=True, output="qa")
+
+        monkeypatch.setattr(
+            "mycroft.server.worker.team_lead.run_code_writer", _mock_success
+        )
+        monkeypatch.setattr(
+            "mycroft.server.worker.team_lead.run_unit_tester", mock_unit_tester
+        )
+        monkeypatch.setattr(
+            "mycroft.server.worker.team_lead.run_qa_tester", mock_qa_tester
+        )
+
+        result = await team_lead._execute_task(team_lead.state.tasks[0])
+        assert not result.success
+        assert result.qa_tester is None
+        assert qa_calls == []
+
+
 class TestTaskResult:
     def test_success(self):
         r = TaskResult(task_id="t1", task_title="Test", success=True)
@@ -139,7 +224,7 @@ def _make_exec_state(tmp_path, monkeypatch):
     state.services = {
         "auth": ServiceRecord(service_name="auth", task_ids=["t1", "t2"]),
     }
-    state._recount()
+    state._full_recount()
     return state
 
 